@@ -1,32 +1,230 @@
 from langchain.tools import Tool
+import asyncio
+import json
+import shlex
 import subprocess
 import os
+import time
+
+# Cap on simultaneous gcloud processes to avoid project-level quota bursts
+MAX_CONCURRENT_GCLOUD = 8
+
+# ADC access tokens live for an hour; share one per credentials file so
+# each gcloud subcommand skips its own token-refresh RPC. Keyed by
+# credential path - tools built for different service accounts must
+# never see each other's tokens.
+_ACCESS_TOKEN_LIFETIME = 3600
+_token_cache = {}  # {credential_path: (token, expiry)}
+
+def _get_access_token(credential_path: str, env: dict):
+    """Returns a cached ADC access token for the given credentials file,
+    refreshing shortly before expiry."""
+    cached = _token_cache.get(credential_path)
+    if cached and time.time() < cached[1] - 60:
+        return cached[0]
+    try:
+        result = subprocess.run(
+            ["gcloud", "auth", "application-default", "print-access-token"],
+            env=env, check=True, text=True,
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except (subprocess.CalledProcessError, OSError):
+        return None
+    token = result.stdout.strip()
+    _token_cache[credential_path] = (token, time.time() + _ACCESS_TOKEN_LIFETIME)
+    return token
+
+def _build_gcloud_env(credential_path: str, project_id: str) -> dict:
+    """Builds the environment for a gcloud subprocess."""
+    env = os.environ.copy()
+    env['GOOGLE_APPLICATION_CREDENTIALS'] = credential_path
+    env['CLOUDSDK_CORE_PROJECT'] = project_id
+    # Tune the fresh gcloud process each call spawns: parallel
+    # composite uploads for storage commands (skipping the
+    # compatibility-check RPC) and no usage-reporting/prompt RPCs
+    # at startup.
+    env['CLOUDSDK_STORAGE_PARALLEL_COMPOSITE_UPLOAD_ENABLED'] = 'True'
+    env['CLOUDSDK_STORAGE_PARALLEL_COMPOSITE_UPLOAD_COMPATIBILITY_CHECK'] = 'False'
+    env['CLOUDSDK_STORAGE_PARALLEL_COMPOSITE_UPLOAD_THRESHOLD'] = '50M'
+    env['CLOUDSDK_CORE_DISABLE_USAGE_REPORTING'] = 'True'
+    env['CLOUDSDK_CORE_DISABLE_PROMPTS'] = 'True'
+    token = _get_access_token(credential_path, env)
+    if token:
+        env['CLOUDSDK_AUTH_ACCESS_TOKEN'] = token
+    return env
+
+def stream_gcloud_command(command: str, credential_path: str, project_id: str,
+                          buffer_size: int = 1 << 20):
+    """Runs a gcloud command, yielding stdout lines as they arrive.
+
+    Streaming instead of check_output-style buffering keeps memory
+    bounded for large JSON listings and lets callers start consuming
+    output before the command finishes.
+    """
+    env = _build_gcloud_env(credential_path, project_id)
+    # Exec gcloud directly with an argv list - no shell fork per call,
+    # and no quote-stripping sanitizer needed since nothing is parsed
+    # by /bin/sh anymore.
+    args = ["gcloud", *shlex.split(command)]
+    with subprocess.Popen(args, env=env, text=True, bufsize=buffer_size,
+                          stdout=subprocess.PIPE, stderr=subprocess.STDOUT) as proc:
+        for line in proc.stdout:
+            yield line
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, args)
 
 def run_gcloud_command(command: str, credential_path: str, project_id: str) -> str:
     """Runs a gcloud command with the specified credentials and project."""
+    chunks = []
+    try:
+        for line in stream_gcloud_command(command, credential_path, project_id):
+            chunks.append(line)
+    except subprocess.CalledProcessError:
+        return f"Error executing command: {''.join(chunks)}"
+    except ValueError as e:
+        return f"Error parsing command: {e}"
+    except OSError as e:
+        return f"Error executing command: {e}"
+    return "".join(chunks)
+
+async def run_gcloud_commands(commands: list, credential_path: str, project_id: str) -> list:
+    """Runs several independent gcloud commands in parallel.
+
+    Wall-clock time collapses to the slowest command instead of the sum,
+    with concurrency capped to avoid quota bursts.
+    """
+    env = _build_gcloud_env(credential_path, project_id)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_GCLOUD)
+
+    async def _run_one(command: str) -> str:
+        async with semaphore:
+            try:
+                args = shlex.split(command)
+            except ValueError as e:
+                return f"Error parsing command: {e}"
+            proc = await asyncio.create_subprocess_exec(
+                "gcloud", *args, env=env,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT)
+            stdout, _ = await proc.communicate()
+            output = stdout.decode("utf-8")
+            if proc.returncode != 0:
+                return f"Error executing command: {output}"
+            return output
+
+    return await asyncio.gather(*[_run_one(c) for c in commands])
+
+# Native SDK clients - initialized once per credentials/project pair and
+# reused so repeated calls share a single authenticated session instead
+# of paying gcloud's process startup (and a fresh connection) per
+# invocation. Keyed rather than singletons: tools built with different
+# credentials must not silently share the first caller's identity.
+_bq_clients = {}  # {(credential_path, project_id): client}
+_billing_clients = {}  # {credential_path: client}
+
+def _get_bq_client(credential_path: str, project_id: str):
+    """Returns a shared google-cloud-bigquery client for the given
+    credentials/project pair."""
+    key = (credential_path, project_id)
+    client = _bq_clients.get(key)
+    if client is None:
+        from google.cloud import bigquery
+        from google.oauth2 import service_account
+        credentials = service_account.Credentials.from_service_account_file(credential_path)
+        client = _bq_clients[key] = bigquery.Client(credentials=credentials, project=project_id)
+    return client
+
+def _get_billing_client(credential_path: str):
+    """Returns a shared google-cloud-billing client for the given credentials."""
+    client = _billing_clients.get(credential_path)
+    if client is None:
+        from google.cloud import billing_v1
+        from google.oauth2 import service_account
+        credentials = service_account.Credentials.from_service_account_file(credential_path)
+        client = _billing_clients[credential_path] = billing_v1.CloudBillingClient(credentials=credentials)
+    return client
+
+def run_bigquery_query(sql: str, credential_path: str, project_id: str) -> str:
+    """Executes a BigQuery SQL query via the native client."""
+    try:
+        client = _get_bq_client(credential_path, project_id)
+        rows = client.query(sql).result()
+        return json.dumps([dict(row) for row in rows], default=str)
+    except Exception as e:
+        return f"Error executing query: {e}"
+
+def list_billing_accounts(credential_path: str) -> str:
+    """Lists billing accounts via the native client."""
     try:
-        env = os.environ.copy()
-        env['GOOGLE_APPLICATION_CREDENTIALS'] = credential_path
-        env['CLOUDSDK_CORE_PROJECT'] = project_id
-        safe_command = sanitize_gcloud_command(command)
-        full_command = f"gcloud {safe_command}"
-        result = subprocess.check_output(full_command, shell=True, env=env, stderr=subprocess.STDOUT)
-    except subprocess.CalledProcessError as e:
-        return f"Error executing command: {e.output.decode()}"
-    return result.decode("utf-8")
-
-def sanitize_gcloud_command(command: str) -> str:
-    return command.replace("'", "").replace('"', '')
+        client = _get_billing_client(credential_path)
+        accounts = client.list_billing_accounts()
+        return json.dumps([
+            {"name": account.name, "display_name": account.display_name, "open": account.open_}
+            for account in accounts
+        ])
+    except Exception as e:
+        return f"Error listing billing accounts: {e}"
 
 # MCP Tool for Gcloud Commands
 def mcp_tool_gcloud(credential_path: str, project_id: str) -> Tool:
     """Creates a MCP tool for executing gcloud commands."""
-    
+
     def _tool_function(command: str) -> str:
+        # Route commands with a native-client equivalent away from the
+        # subprocess path - the SDK clients reuse one HTTP session.
+        stripped = command.strip()
+        if stripped.startswith("bq query"):
+            sql = stripped[len("bq query"):].strip().strip("'\"")
+            if sql:
+                return run_bigquery_query(sql, credential_path, project_id)
+        if stripped.startswith("billing accounts list"):
+            return list_billing_accounts(credential_path)
         return run_gcloud_command(command, credential_path, project_id)
     
     return Tool(
         name="mcp_tool_gcloud",
         func=_tool_function,
         description="A tool to execute gcloud commands with specified credentials and project."
+    )
+
+# MCP Tool for batched Gcloud Commands
+def mcp_tool_gcloud_batch(credential_path: str, project_id: str) -> Tool:
+    """Creates a MCP tool for executing independent gcloud commands in parallel."""
+
+    def _tool_function(commands: str) -> str:
+        command_list = [c.strip() for c in commands.split('\n') if c.strip()]
+        results = asyncio.run(run_gcloud_commands(command_list, credential_path, project_id))
+        return "\n".join(results)
+
+    return Tool(
+        name="mcp_tool_gcloud_batch",
+        func=_tool_function,
+        description="A tool to execute multiple independent gcloud commands in parallel. "
+                    "Provide one command per line."
+    )
+
+# MCP Tool for BigQuery queries via the native client
+def mcp_tool_bigquery(credential_path: str, project_id: str) -> Tool:
+    """Creates a MCP tool for running BigQuery SQL via google-cloud-bigquery."""
+
+    def _tool_function(sql: str) -> str:
+        return run_bigquery_query(sql, credential_path, project_id)
+
+    return Tool(
+        name="mcp_tool_bigquery",
+        func=_tool_function,
+        description="A tool to execute a BigQuery SQL query using the native client. "
+                    "Faster than gcloud for repeated queries."
+    )
+
+# MCP Tool for billing account listing via the native client
+def mcp_tool_billing(credential_path: str) -> Tool:
+    """Creates a MCP tool for listing billing accounts via google-cloud-billing."""
+
+    def _tool_function(_: str = "") -> str:
+        return list_billing_accounts(credential_path)
+
+    return Tool(
+        name="mcp_tool_billing",
+        func=_tool_function,
+        description="A tool to list billing accounts using the native client."
     )
\ No newline at end of file
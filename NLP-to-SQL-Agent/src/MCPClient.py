@@ -8,8 +8,52 @@ Can be imported and used in other applications.
 
 import asyncio
 import aiohttp
+import itertools
 import json
-from typing import Dict, Any, Optional
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Optional accelerator: the libuv-backed event loop noticeably lowers
+# per-request socket overhead for the many small JSON-RPC POSTs this
+# client makes. Falls back to the default loop when not installed.
+try:
+    if sys.platform != "win32":
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    else:
+        import winloop
+        asyncio.set_event_loop_policy(winloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# orjson is a C extension that serializes to / parses from bytes directly,
+# 2-5x faster than stdlib json on the per-call payload hot path.
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    _json_loads = json.loads
+
+# Base headers shared by every JSON-RPC POST (session id merged in per call)
+BASE_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json, text/event-stream"
+}
+
+# Schema context cache, shared across clients and keyed by base_url.
+# Schemas change on the order of hours, not per request, so a short TTL
+# saves an MCP round trip on every query after the first.
+SCHEMA_CACHE_TTL = 600
+_schema_cache: Dict[str, Tuple[float, str]] = {}
 
 
 class MCPClient:
@@ -26,6 +70,8 @@ class MCPClient:
         self.session: Optional[aiohttp.ClientSession] = None
         self.session_id: Optional[str] = None
         self.initialized = False
+        self.last_used = 0.0  # monotonic timestamp set when released to a pool
+        self._request_ids = itertools.count(2)  # id 1 is used by initialize
     
     async def __aenter__(self):
         """Async context manager entry"""
@@ -40,9 +86,30 @@ class MCPClient:
         """Connect to MCP server and initialize session"""
         if self.session:
             return
-        
-        self.session = aiohttp.ClientSession()
-        
+
+        # Tuned connector: keep idle sockets alive well past the default ~15s
+        # so repeated JSON-RPC POSTs reuse the same TCP (and TLS) connection
+        # instead of paying a fresh handshake per tool call.
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=32,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+            ttl_dns_cache=300
+        )
+        # gzip/deflate: aiohttp decompresses transparently, so responses
+        # (large schema contexts, query results) shrink on the wire for
+        # free. Concurrent call_tool invocations run in parallel over
+        # the connector pool above (aiohttp has no HTTP/2 multiplexing).
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers={
+                "Connection": "keep-alive",
+                "Accept-Encoding": "gzip, deflate"
+            },
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+
         # Initialize MCP session
         payload = {
             "jsonrpc": "2.0",
@@ -54,14 +121,11 @@ class MCPClient:
                 "clientInfo": {"name": "mcp-client", "version": "1.0.0"}
             }
         }
-        
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json, text/event-stream"
-        }
-        
+
+        headers = BASE_HEADERS
+
         try:
-            async with self.session.post(f"{self.base_url}/mcp", json=payload, headers=headers) as response:
+            async with self.session.post(f"{self.base_url}/mcp", data=_json_dumps(payload), headers=headers) as response:
                 if response.status == 200:
                     self.session_id = response.headers.get('mcp-session-id')
                     await self._send_initialized()
@@ -89,15 +153,11 @@ class MCPClient:
             "jsonrpc": "2.0",
             "method": "notifications/initialized"
         }
-        
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json, text/event-stream",
-            "mcp-session-id": self.session_id
-        }
-        
+
+        headers = dict(BASE_HEADERS, **{"mcp-session-id": self.session_id})
+
         try:
-            async with self.session.post(f"{self.base_url}/mcp", json=payload, headers=headers) as response:
+            async with self.session.post(f"{self.base_url}/mcp", data=_json_dumps(payload), headers=headers) as response:
                 pass  # Notification doesn't require response handling
         except Exception:
             pass  # Non-critical error
@@ -118,34 +178,140 @@ class MCPClient:
         """
         if not self.initialized:
             raise Exception("MCP client not connected. Use 'await client.connect()' or context manager.")
-        
-        payload = {
+
+        payload = self._build_call_payload(next(self._request_ids), tool_name, arguments)
+
+        headers = dict(BASE_HEADERS, **{"mcp-session-id": self.session_id})
+
+        try:
+            async with self.session.post(f"{self.base_url}/mcp", data=_json_dumps(payload), headers=headers) as response:
+                if response.status == 200:
+                    return await self._read_sse_stream(response)
+                else:
+                    error_text = await response.text()
+                    raise Exception(f"Tool call failed: HTTP {response.status} - {error_text}")
+        except Exception as e:
+            raise Exception(f"Tool '{tool_name}' call failed: {e}")
+
+    async def _read_sse_stream(self, response: aiohttp.ClientResponse) -> Any:
+        """Incrementally parse an SSE response, returning on the first result frame.
+
+        Streaming line by line avoids buffering the whole body (bytes plus
+        a decoded copy) before parsing, and lets large query results
+        return as soon as the result frame arrives instead of at EOF.
+        """
+        async for raw_line in response.content:
+            line = raw_line.strip()
+            if not line.startswith(b'data: '):
+                continue
+            try:
+                result = _json_loads(line[6:])
+            except ValueError:
+                continue
+            return self._extract_tool_result(result)
+
+        raise Exception("No valid response data found")
+
+    @staticmethod
+    def _build_call_payload(request_id: int, tool_name: str, arguments: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Build a JSON-RPC tools/call payload"""
+        return {
             "jsonrpc": "2.0",
-            "id": 2,
+            "id": request_id,
             "method": "tools/call",
             "params": {
                 "name": tool_name,
                 "arguments": arguments or {}
             }
         }
-        
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json, text/event-stream",
-            "mcp-session-id": self.session_id
-        }
-        
+
+    async def call_tools_batch(self, calls: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Any]:
+        """
+        Call several independent MCP tools in one JSON-RPC batch request
+
+        Args:
+            calls: List of (tool_name, arguments) tuples
+
+        Returns:
+            Tool results in the same order as the input calls
+
+        Falls back to sequential call_tool invocations if the server
+        rejects batch arrays (JSON-RPC error -32600).
+        """
+        if not self.initialized:
+            raise Exception("MCP client not connected. Use 'await client.connect()' or context manager.")
+        if not calls:
+            return []
+
+        ids = [next(self._request_ids) for _ in calls]
+        payload = [
+            self._build_call_payload(request_id, name, args)
+            for request_id, (name, args) in zip(ids, calls)
+        ]
+
+        headers = dict(BASE_HEADERS, **{"mcp-session-id": self.session_id})
+
         try:
-            async with self.session.post(f"{self.base_url}/mcp", json=payload, headers=headers) as response:
+            async with self.session.post(f"{self.base_url}/mcp", data=_json_dumps(payload), headers=headers) as response:
                 if response.status == 200:
                     content = await response.text()
-                    return self._parse_sse_response(content)
+                    results_by_id = self._parse_sse_batch_response(content)
                 else:
                     error_text = await response.text()
-                    raise Exception(f"Tool call failed: HTTP {response.status} - {error_text}")
+                    raise Exception(f"Batch call failed: HTTP {response.status} - {error_text}")
         except Exception as e:
-            raise Exception(f"Tool '{tool_name}' call failed: {e}")
-    
+            raise Exception(f"Batch tool call failed: {e}")
+
+        # Some servers reject batch arrays outright - retry sequentially
+        if results_by_id is None:
+            return [await self.call_tool(name, args) for name, args in calls]
+
+        return [results_by_id.get(request_id) for request_id in ids]
+
+    def _parse_sse_batch_response(self, content: str) -> Optional[Dict[int, Any]]:
+        """Parse a batched SSE response into {request_id: result}.
+
+        Returns None if the server rejected the batch with -32600
+        (Invalid Request), signalling the caller to fall back to
+        sequential calls.
+        """
+        results: Dict[int, Any] = {}
+        for line in content.strip().split('\n'):
+            if not line.startswith('data: '):
+                continue
+            try:
+                parsed = _json_loads(line[6:])
+            except ValueError:
+                continue
+            # The whole batch response may arrive as one JSON array
+            items = parsed if isinstance(parsed, list) else [parsed]
+            for item in items:
+                if not isinstance(item, dict):
+                    continue
+                error = item.get("error")
+                if error and error.get("code") == -32600:
+                    return None
+                if "id" in item:
+                    results[item["id"]] = self._extract_tool_result(item)
+        return results
+
+    def _extract_tool_result(self, result: Dict[str, Any]) -> Any:
+        """Unwrap a JSON-RPC response object down to the tool's payload"""
+        if "result" in result:
+            tool_result = result["result"]
+            if "content" in tool_result and tool_result["content"]:
+                first_content = tool_result["content"][0]
+                if "text" in first_content:
+                    return first_content["text"]
+                else:
+                    return first_content
+            else:
+                return tool_result
+        elif "error" in result:
+            raise Exception(f"Tool error: {result['error']}")
+        else:
+            return result
+
     def _parse_sse_response(self, content: str) -> Any:
         """Parse Server-Sent Events response"""
         lines = content.strip().split('\n')
@@ -153,40 +319,283 @@ class MCPClient:
             if line.startswith('data: '):
                 data = line[6:]  # Remove 'data: ' prefix
                 try:
-                    result = json.loads(data)
-                    if "result" in result:
-                        tool_result = result["result"]
-                        if "content" in tool_result and tool_result["content"]:
-                            first_content = tool_result["content"][0]
-                            if "text" in first_content:
-                                return first_content["text"]
-                            else:
-                                return first_content
-                        else:
-                            return tool_result
-                    elif "error" in result:
-                        raise Exception(f"Tool error: {result['error']}")
-                    else:
-                        return result
-                except json.JSONDecodeError:
+                    result = _json_loads(data)
+                    return self._extract_tool_result(result)
+                except ValueError:
                     continue
-        
+
         raise Exception("No valid response data found")
     
     # Convenience methods for common tools
     async def health_check(self) -> dict:
         """Check server health"""
         result = await self.call_tool("health_check")
-        return json.loads(result) if isinstance(result, str) else result
+        return _json_loads(result) if isinstance(result, str) else result
     
     async def get_schema_context(self) -> str:
-        """Get database schema context"""
-        return await self.call_tool("schema_context")
+        """Get database schema context (cached with a 10 minute TTL)"""
+        cached = _schema_cache.get(self.base_url)
+        if cached and time.monotonic() - cached[0] < SCHEMA_CACHE_TTL:
+            return cached[1]
+
+        schema = await self.call_tool("schema_context")
+        _schema_cache[self.base_url] = (time.monotonic(), schema)
+        return schema
+
+    def refresh_schema(self):
+        """Drop the cached schema context so the next call refetches it"""
+        _schema_cache.pop(self.base_url, None)
     
     async def query_bigquery(self, query: str) -> dict:
         """Execute BigQuery SQL query"""
         result = await self.call_tool("query_bigquery", {"query": query})
-        return json.loads(result) if isinstance(result, str) else result
+        return _json_loads(result) if isinstance(result, str) else result
+
+    async def run_query_paged_async(self, query: str, page_size: int = 1000):
+        """
+        Execute a query and yield result pages instead of all rows at once
+
+        Uses the server's execute_query / fetch_next_page / close_query
+        cursor tools, so the first page arrives after one page's round
+        trip and client memory stays O(page_size).
+
+        Args:
+            query: SQL query to execute
+            page_size: Rows per page
+
+        Yields:
+            Lists of row dicts, one list per page
+        """
+        result = await self.call_tool("execute_query", {"query": query, "page_size": page_size})
+        if isinstance(result, str):
+            result = _json_loads(result)
+        if "error" in result:
+            raise Exception(f"Paged query failed: {result['error']}")
+
+        cursor = result["cursor"]
+        try:
+            while True:
+                page = await self.call_tool("fetch_next_page", {"cursor": cursor})
+                if isinstance(page, str):
+                    page = _json_loads(page)
+                rows = page.get("rows", [])
+                if rows:
+                    yield rows
+                if page.get("done") or not rows:
+                    break
+        finally:
+            try:
+                await self.call_tool("close_query", {"cursor": cursor})
+            except Exception:
+                pass  # Cursor is already released when exhausted
+
+
+class MCPSessionPool:
+    """Pool of initialized MCPClient instances keyed by base_url.
+
+    Reusing an already-initialized client skips the initialize +
+    notifications/initialized round trips that a fresh MCPClient pays
+    on every connect(). Clients idle longer than session_ttl get a
+    cheap health check before being handed out again, and are
+    reconnected if the server dropped the session.
+    """
+
+    def __init__(self, max_sessions_per_url: int = 10, session_ttl: float = 300):
+        """
+        Initialize the session pool
+
+        Args:
+            max_sessions_per_url: Maximum idle clients kept per server URL
+            session_ttl: Seconds after which an idle session is health-checked
+        """
+        self.max_sessions_per_url = max_sessions_per_url
+        self.session_ttl = session_ttl
+        self._pools: Dict[str, asyncio.Queue] = {}
+
+    def _queue_for(self, base_url: str) -> asyncio.Queue:
+        url = base_url.rstrip('/')
+        if url not in self._pools:
+            self._pools[url] = asyncio.Queue(maxsize=self.max_sessions_per_url)
+        return self._pools[url]
+
+    async def acquire(self, base_url: str = "http://localhost:8000") -> MCPClient:
+        """Get an initialized client, reusing an idle one when possible"""
+        queue = self._queue_for(base_url)
+        while not queue.empty():
+            client = queue.get_nowait()
+            if time.monotonic() - client.last_used <= self.session_ttl:
+                return client
+            # Stale session - verify it before reuse, reconnect if dead
+            try:
+                await client.health_check()
+                return client
+            except Exception:
+                await client.disconnect()
+
+        client = MCPClient(base_url)
+        await client.connect()
+        return client
+
+    async def release(self, client: MCPClient):
+        """Return a client to the pool for reuse"""
+        if not client.initialized:
+            return
+        client.last_used = time.monotonic()
+        queue = self._queue_for(client.base_url)
+        try:
+            queue.put_nowait(client)
+        except asyncio.QueueFull:
+            await client.disconnect()
+
+    async def call_tool(self, base_url: str, tool_name: str, arguments: Dict[str, Any] = None) -> Any:
+        """Call a tool using a pooled session (acquire/release handled here)"""
+        client = await self.acquire(base_url)
+        try:
+            return await client.call_tool(tool_name, arguments)
+        finally:
+            await self.release(client)
+
+    async def close(self):
+        """Disconnect all pooled clients"""
+        for queue in self._pools.values():
+            while not queue.empty():
+                await queue.get_nowait().disconnect()
+        self._pools.clear()
+
+
+# Default pool shared across the application
+session_pool = MCPSessionPool()
+
+
+# App-wide shared client so multiple callers reuse one connection pool
+_shared_client: Optional[MCPClient] = None
+
+
+async def get_mcp_client(base_url: str = "http://localhost:8000") -> MCPClient:
+    """
+    Get a shared, connected MCPClient instance.
+
+    Multiple callers get the same client (and therefore the same
+    connection pool), so keep-alive sockets are actually reused.
+
+    Args:
+        base_url: Base URL of the MCP server
+
+    Returns:
+        A connected MCPClient instance
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.base_url != base_url.rstrip('/'):
+        _shared_client = MCPClient(base_url)
+    if not _shared_client.initialized:
+        await _shared_client.connect()
+    return _shared_client
+
+
+# Pre-connected clients created by warm_pool(), keyed by base_url
+_warm_clients: Dict[str, MCPClient] = {}
+
+
+async def warm_pool(urls: List[str]) -> None:
+    """
+    Pre-connect one MCPClient per URL at application start
+
+    Doing the initialize + notifications/initialized handshake up front
+    moves the cold-start cost off the user-visible path; later callers
+    fetch the already-initialized client with get_warm_client().
+
+    Args:
+        urls: Base URLs of the MCP servers to warm up
+    """
+    async def _connect(url: str):
+        url = url.rstrip('/')
+        existing = _warm_clients.get(url)
+        if existing and existing.initialized:
+            return
+        client = MCPClient(url)
+        try:
+            await client.connect()
+            _warm_clients[url] = client
+        except Exception as e:
+            print(f"WARNING: MCP warm-up failed for {url}: {e}")
+
+    await asyncio.gather(*[_connect(url) for url in urls])
+
+
+def get_warm_client(base_url: str = "http://localhost:8000") -> Optional[MCPClient]:
+    """Return the pre-connected client for base_url, if warm_pool() made one"""
+    return _warm_clients.get(base_url.rstrip('/'))
+
+
+# Persistent background event loop for synchronous callers.
+# asyncio.run() per call would spin up and tear down a loop (and with it
+# any connected session) every time; one long-lived loop on a daemon
+# thread lets sync code reuse the shared client's keep-alive pool.
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _ensure_loop() -> asyncio.AbstractEventLoop:
+    """Lazily start the shared background event loop"""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_LOOP.run_forever, daemon=True).start()
+    return _LOOP
+
+
+def run_sync(coro):
+    """Run a coroutine on the shared background loop and wait for the result"""
+    return asyncio.run_coroutine_threadsafe(coro, _ensure_loop()).result()
+
+
+def call_tool_sync(tool_name: str, arguments: Dict[str, Any] = None,
+                   base_url: str = "http://localhost:8000") -> Any:
+    """
+    Call an MCP tool from synchronous code
+
+    Uses the shared client on the background loop, so repeated calls
+    reuse one connection pool instead of reconnecting per call.
+
+    Args:
+        tool_name: Name of the tool to call
+        arguments: Tool arguments (optional)
+        base_url: Base URL of the MCP server
+
+    Returns:
+        Tool response data
+    """
+    async def _call():
+        client = await get_mcp_client(base_url)
+        return await client.call_tool(tool_name, arguments)
+
+    return run_sync(_call())
+
+
+def run_query_paged_sync(query: str, page_size: int = 1000,
+                         base_url: str = "http://localhost:8000"):
+    """
+    Iterate query result pages from synchronous code
+
+    Args:
+        query: SQL query to execute
+        page_size: Rows per page
+        base_url: Base URL of the MCP server
+
+    Yields:
+        Lists of row dicts, one list per page
+    """
+    async def _open():
+        client = await get_mcp_client(base_url)
+        return client.run_query_paged_async(query, page_size)
+
+    page_iter = run_sync(_open())
+    while True:
+        try:
+            yield run_sync(page_iter.__anext__())
+        except StopAsyncIteration:
+            break
 
 
 # Example usage functions
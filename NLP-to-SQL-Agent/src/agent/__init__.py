@@ -1,5 +1,6 @@
 from .table_selector import TableSelector
 from .nl2sql_agent import NL2SQLAgent
 from .answer_agent import AnswerAgent
+from .query_decomposer import QueryDecomposer
 
-__all__ = ["TableSelector", "NL2SQLAgent", "AnswerAgent"]
\ No newline at end of file
+__all__ = ["TableSelector", "NL2SQLAgent", "AnswerAgent", "QueryDecomposer"]
\ No newline at end of file
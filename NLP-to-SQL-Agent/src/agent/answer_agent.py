@@ -1,6 +1,12 @@
 import dspy
+import json
 from typing import Dict, Any
 
+from .llm_cache import cached_call
+
+# Cap on raw rows included in the LLM prompt
+MAX_SAMPLE_ROWS = 10
+
 class AnswerSignature(dspy.Signature):
     """Summarize SQL query results in natural language."""
     user_query = dspy.InputField(desc="The original user query")
@@ -14,9 +20,66 @@ class AnswerAgent(dspy.Module):
         self.summarizer = dspy.ChainOfThought(AnswerSignature)
     
     def forward(self, user_query: str, sql_query: str, results: Dict[str, Any]):
-        result = self.summarizer(
-            user_query=user_query,
-            sql_query=sql_query,
-            query_results=str(results)
+        results_str = json.dumps(self._summarize_results(results), default=str)
+        result = cached_call(
+            lambda: self.summarizer(
+                user_query=user_query,
+                sql_query=sql_query,
+                query_results=results_str
+            ),
+            "answer", user_query, sql_query, results_str
         )
-        return result
\ No newline at end of file
+        return result
+
+    @staticmethod
+    def _summarize_results(results: Any) -> Dict[str, Any]:
+        """Build a compact summary of query results for the LLM prompt.
+
+        Shipping every row as a Python repr blows up prompt tokens for
+        large result sets; the model only needs the shape, a sample,
+        and per-column aggregates to write a good answer.
+        """
+        if not isinstance(results, dict):
+            return {"results": str(results)}
+
+        rows = results.get("results")
+        if not isinstance(rows, list) or not rows:
+            return results
+
+        summary = {
+            "row_count": len(rows),
+            "columns": list(rows[0].keys()) if isinstance(rows[0], dict) else [],
+            "sample_rows": rows[:MAX_SAMPLE_ROWS],
+        }
+
+        # Single pass over the rows for numeric column aggregates
+        stats: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            if not isinstance(row, dict):
+                continue
+            for col, value in row.items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                col_stats = stats.get(col)
+                if col_stats is None:
+                    stats[col] = {"min": value, "max": value, "sum": value, "count": 1}
+                else:
+                    if value < col_stats["min"]:
+                        col_stats["min"] = value
+                    if value > col_stats["max"]:
+                        col_stats["max"] = value
+                    col_stats["sum"] += value
+                    col_stats["count"] += 1
+
+        if stats:
+            summary["numeric_stats"] = {
+                col: {
+                    "min": s["min"],
+                    "max": s["max"],
+                    "mean": s["sum"] / s["count"],
+                    "sum": s["sum"],
+                }
+                for col, s in stats.items()
+            }
+
+        return summary
\ No newline at end of file
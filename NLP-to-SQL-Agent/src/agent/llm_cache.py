@@ -0,0 +1,46 @@
+import hashlib
+import os
+
+# Optional persistent backend - falls back to an in-process dict so the
+# agents work (with per-run caching only) when diskcache isn't installed.
+try:
+    import diskcache
+    _cache = diskcache.Cache("./.dspy_cache", size_limit=1 << 30)
+except ImportError:
+    _cache = {}
+
+# Set DSPY_CACHE=off to bypass caching entirely
+CACHE_ENABLED = os.getenv("DSPY_CACHE", "on").lower() != "off"
+
+_MISSING = object()
+
+
+def cache_key(*parts: str) -> str:
+    """Build a stable content hash from the prompt parts."""
+    hasher = hashlib.blake2b()
+    for part in parts:
+        hasher.update(str(part).encode("utf-8", "replace"))
+        hasher.update(b"\x00")
+    return hasher.hexdigest()
+
+
+def cached_call(fn, *parts):
+    """Call fn() memoized on a content hash of the given prompt parts.
+
+    Repeated queries with identical prompts skip the LLM round trip and
+    return the stored prediction instead.
+    """
+    if not CACHE_ENABLED:
+        return fn()
+
+    key = cache_key(*parts)
+    value = _cache.get(key, _MISSING)
+    if value is not _MISSING and value is not None:
+        return value
+
+    value = fn()
+    try:
+        _cache[key] = value
+    except Exception:
+        pass  # Unpicklable predictions just skip the persistent cache
+    return value
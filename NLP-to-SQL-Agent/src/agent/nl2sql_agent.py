@@ -1,6 +1,8 @@
 import dspy
 from typing import Dict, Any
 
+from .llm_cache import cached_call
+
 class NL2SQLSignature(dspy.Signature):
     """Convert natural language query to SQL with reasoning."""
     user_query = dspy.InputField(desc="The user's natural language query")
@@ -24,8 +26,11 @@ class NL2SQLAgent(dspy.Module):
         Use fully qualified table names like `bigquery-public-data.thelook_ecommerce.table_name`.
         """
         
-        result = self.generator(
-            user_query=enhanced_query,
-            schema_info=schema_str
+        result = cached_call(
+            lambda: self.generator(
+                user_query=enhanced_query,
+                schema_info=schema_str
+            ),
+            "nl2sql", enhanced_query, schema_str
         )
         return result
\ No newline at end of file
@@ -0,0 +1,26 @@
+import dspy
+from typing import List
+
+from .llm_cache import cached_call
+
+class QueryDecomposerSignature(dspy.Signature):
+    """Split a compound question into independent sub-questions."""
+    user_query = dspy.InputField(desc="The user's natural language query")
+    sub_questions = dspy.OutputField(desc="Newline-separated independent sub-questions; a single line if the question is not compound")
+
+class QueryDecomposer(dspy.Module):
+    def __init__(self):
+        super().__init__()
+        self.decomposer = dspy.ChainOfThought(QueryDecomposerSignature)
+
+    def forward(self, user_query: str) -> List[str]:
+        result = cached_call(
+            lambda: self.decomposer(user_query=user_query),
+            "decompose", user_query
+        )
+        # Parse the newline-separated result, tolerating list bullets
+        sub_questions = [
+            line.strip(" -*\t") for line in result.sub_questions.split("\n")
+            if line.strip(" -*\t")
+        ]
+        return sub_questions or [user_query]
@@ -1,5 +1,7 @@
 import dspy
-from typing import List
+from typing import List, Optional
+
+from .llm_cache import cached_call
 
 class TableSelectorSignature(dspy.Signature):
     """Select relevant tables for a given user query."""
@@ -11,14 +13,35 @@ class TableSelector(dspy.Module):
     def __init__(self, all_tables: List[str]):
         super().__init__()
         self.all_tables = all_tables
+        # Precompute the membership structures once: set lookup is O(1)
+        # per candidate, and the lower-case map canonicalizes whatever
+        # casing the LLM echoes back.
+        self._all_tables_set = frozenset(all_tables)
+        self._lower_map = {table.lower(): table for table in all_tables}
+        self._tables_str = ", ".join(all_tables)
         self.selector = dspy.ChainOfThought(TableSelectorSignature)
-    
-    def forward(self, user_query: str) -> List[str]:
-        tables_str = ", ".join(self.all_tables)
-        result = self.selector(
-            user_query=user_query,
-            available_tables=tables_str
+
+    def forward(self, user_query: str, candidate_tables: Optional[List[str]] = None) -> List[str]:
+        # A narrowed per-query candidate list only changes this call's
+        # prompt and match map; the module (and its ChainOfThought) is
+        # shared across questions
+        if candidate_tables:
+            tables_str = ", ".join(candidate_tables)
+            lower_map = {table.lower(): table for table in candidate_tables}
+        else:
+            tables_str = self._tables_str
+            lower_map = self._lower_map
+        result = cached_call(
+            lambda: self.selector(
+                user_query=user_query,
+                available_tables=tables_str
+            ),
+            "table_selector", user_query, tables_str
         )
-        # Parse the comma-separated result
-        selected = [table.strip() for table in result.selected_tables.split(",")]
-        return [table for table in selected if table in self.all_tables]
\ No newline at end of file
+        # Parse the comma-separated result, matching case-insensitively
+        selected = []
+        for raw in result.selected_tables.split(","):
+            table = lower_map.get(raw.strip().lower())
+            if table is not None and table not in selected:
+                selected.append(table)
+        return selected
\ No newline at end of file
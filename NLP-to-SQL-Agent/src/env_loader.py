@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+One-shot .env loading
+
+Every module that needs configuration used to call load_dotenv at import
+time, so importing several of them together parsed .env from disk once
+per module. load_once() reads and parses it a single time per process;
+later callers hit the sentinel and return immediately.
+"""
+
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# Resolved once at import instead of recomputing Path(__file__) parents
+# in every module that wants the project root
+PROJECT_ROOT = Path(__file__).parent.parent
+ENV_PATH = PROJECT_ROOT / ".env"
+
+_LOADED = False
+
+
+def load_once() -> None:
+    """Load the project .env into os.environ, at most once per process."""
+    global _LOADED
+    if _LOADED:
+        return
+    load_dotenv(ENV_PATH)
+    _LOADED = True
@@ -5,20 +5,120 @@ Updated main.py using the working MCPClient with SQL cleaning
 
 import dspy
 import asyncio
+import concurrent.futures
+import functools
+import io
 import os
 import re
-from pathlib import Path
-from dotenv import load_dotenv
+import sys
+import pandas as pd
+from env_loader import load_once
 from MCPClient import MCPClient
-from agent import TableSelector, NL2SQLAgent, AnswerAgent
+from agent import TableSelector, NL2SQLAgent, AnswerAgent, QueryDecomposer
+import query_cache
+from table_prefilter import preselect
 
-# Load environment variables from .env file in project root
-project_root = Path(__file__).parent.parent
-env_path = project_root / ".env"
-load_dotenv(env_path)
+# sqlglot validates/normalizes the generated SQL; optional, regex-only
+# cleanup still works without it
+try:
+    import sqlglot
+    import sqlglot.errors
+except ImportError:
+    sqlglot = None
 
+# prompt_toolkit gives real async input; without it we fall back to
+# running input() on a worker thread, which also keeps the loop free
+try:
+    from prompt_toolkit import PromptSession
+except ImportError:
+    PromptSession = None
+
+# Load environment variables from .env file in project root (once per
+# process, even if several modules import this path)
+load_once()
+
+# DSPy agent calls block (LLM HTTP round trip plus CPU-side parsing of
+# the response), which would stall the event loop the MCP client runs
+# on. Offload them to worker threads; a process pool is out because
+# dspy modules don't pickle.
+_AGENT_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Compiled once; matches ```sql ... ``` or ``` ... ``` fences
+_MD_FENCE_RE = re.compile(r'```(?:sql)?\s*\n?(.*?)\n?```', flags=re.DOTALL)
+
+# Schema parsing: unindented "name:" lines are table headers, minus
+# the section headings the schema context itself emits
+_HEADER_RE = re.compile(r'^(\S.*?):\s*$')
+_SKIP_HEADERS = frozenset({'database schema and context', 'tables', 'columns'})
+
+# Cheap detector for questions that likely bundle several asks
+_COMPOUND_RE = re.compile(r'\b(?:and|vs|versus|compare[d]?)\b', re.IGNORECASE)
+
+# Agent instances are reused across questions - DSPy module construction
+# (signature setup, ChainOfThought wiring) isn't free. Only TableSelector
+# depends on the table list, so it's keyed by the full sorted table
+# tuple - one entry per schema, not per question; per-question
+# candidate narrowing is passed to forward() instead of baked into the
+# module, so the dict stays bounded by the number of distinct schemas.
+_TABLE_SELECTORS = {}
+_NL2SQL_AGENT = None
+_ANSWER_AGENT = None
+_DECOMPOSER = None
+
+def _get_answer_agent():
+    """Return the cached AnswerAgent instance."""
+    global _ANSWER_AGENT
+    if _ANSWER_AGENT is None:
+        _ANSWER_AGENT = AnswerAgent()
+    return _ANSWER_AGENT
+
+def _get_selector(available_tables):
+    """Return the cached TableSelector for the full table list."""
+    key = tuple(sorted(available_tables))
+    selector = _TABLE_SELECTORS.get(key)
+    if selector is None:
+        selector = _TABLE_SELECTORS[key] = TableSelector(list(available_tables))
+    return selector
+
+def _get_nl2sql_agent():
+    """Return the cached NL2SQLAgent instance."""
+    global _NL2SQL_AGENT
+    if _NL2SQL_AGENT is None:
+        _NL2SQL_AGENT = NL2SQLAgent()
+    return _NL2SQL_AGENT
+
+def _get_decomposer():
+    """Return the cached QueryDecomposer instance."""
+    global _DECOMPOSER
+    if _DECOMPOSER is None:
+        _DECOMPOSER = QueryDecomposer()
+    return _DECOMPOSER
+
+# One LM (and therefore one underlying OpenAI client + connection pool)
+# per process; dspy.configure is sticky, so this only needs to run once
+_LM = None
+
+def _ensure_dspy():
+    """Configure DSPy with a single shared LM, constructing it on first use."""
+    global _LM
+    if _LM is None:
+        model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+        _LM = dspy.LM(model=model, max_retries=2)
+        dspy.configure(lm=_LM)
+    return _LM
+
+async def run_agent(agent, *args, **kwargs):
+    """Run a blocking DSPy agent call off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_AGENT_POOL, functools.partial(agent, *args, **kwargs))
+
+@functools.lru_cache(maxsize=1)
 def check_openai_key():
-    """Check if OpenAI API key is properly configured."""
+    """Check if OpenAI API key is properly configured.
+
+    Memoized - the key doesn't change mid-process, so repeated entry
+    points share one check (and one round of status output).
+    """
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         print("ERROR: OPENAI_API_KEY not found!")
@@ -26,7 +126,7 @@ def check_openai_key():
         print("   1. Environment variable: $env:OPENAI_API_KEY='sk-your-key-here'")
         print("   2. Create .env file with: OPENAI_API_KEY=sk-your-key-here")
         return False
-    elif not (api_key.startswith("sk-") or api_key.startswith("sk-svcacct-")):
+    elif not api_key.startswith(("sk-", "sk-svcacct-")):
         print("WARNING: OPENAI_API_KEY doesn't look like a valid OpenAI key")
         print(f"   Current value: {api_key[:10]}...")
         return False
@@ -34,111 +134,187 @@ def check_openai_key():
         print(f"SUCCESS: OpenAI API key configured: {api_key[:10]}...{api_key[-4:]}")
         return True
 
-def clean_sql_from_markdown(sql_text: str) -> str:
+def clean_sql_from_markdown(sql_text: str, out=None) -> str:
     """
     Clean SQL text by removing markdown code blocks and other formatting.
     
     Args:
         sql_text: Raw SQL text that may contain markdown formatting
+        out: Optional writable the status lines go to (defaults to stdout)
         
     Returns:
         Clean SQL text ready for execution
     """
-    print(f"CLEANING: SQL. Original length: {len(sql_text)} chars")
+    echo = functools.partial(print, file=out) if out is not None else print
+    echo(f"CLEANING: SQL. Original length: {len(sql_text)} chars")
     
     # Remove markdown code blocks
-    # Pattern matches ```sql ... ``` or ``` ... ```
-    sql_cleaned = re.sub(r'```(?:sql)?\s*\n?(.*?)\n?```', r'\1', sql_text, flags=re.DOTALL)
+    sql_cleaned = _MD_FENCE_RE.sub(r'\1', sql_text)
     
     # Remove any remaining backticks at start/end
     sql_cleaned = sql_cleaned.strip('`')
     
     # Remove extra whitespace and newlines
     sql_cleaned = sql_cleaned.strip()
-    
-    print(f"CLEANED: SQL. New length: {len(sql_cleaned)} chars")
+
+    # Canonicalize through sqlglot when available: one parse pass that
+    # normalizes the statement and catches malformed LLM output before
+    # we pay for a BigQuery job
+    if sqlglot is not None:
+        try:
+            sql_cleaned = sqlglot.parse_one(sql_cleaned, read='bigquery').sql(dialect='bigquery')
+        except sqlglot.errors.ParseError as e:
+            echo(f"WARNING: Generated SQL did not parse cleanly ({e}); using stripped text")
+
+    echo(f"CLEANED: SQL. New length: {len(sql_cleaned)} chars")
     
     # Show the difference if cleaning was applied
     if sql_cleaned != sql_text.strip():
-        print("REMOVED: Markdown formatting from SQL")
+        echo("REMOVED: Markdown formatting from SQL")
     
     return sql_cleaned
 
-async def process_query_async(user_query: str, client: MCPClient):
-    """Process a single user query through the NLP-to-SQL pipeline using real MCP."""
-    print(f"\n{'='*60}")
-    print(f"USER QUERY: {user_query}")
-    print(f"{'='*60}")
-    print()
+async def process_query_async(user_query: str, client: MCPClient, decompose: bool = True):
+    """Process a single user query through the NLP-to-SQL pipeline using real MCP.
+
+    The ~40 status prints per query are collected in a per-call buffer
+    and written to stdout in one go - one syscall instead of a
+    lock/encode/flush per line, which dominates the happy path once the
+    network calls are cached. The buffer is passed explicitly rather
+    than installed via redirect_stdout: swapping the global sys.stdout
+    is not task-safe, and decomposed questions run several of these
+    coroutines concurrently under asyncio.gather.
+    """
+    buffer = io.StringIO()
+    try:
+        return await _process_query_impl(user_query, client, decompose, buffer)
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+async def _process_query_impl(user_query: str, client: MCPClient, decompose: bool, out):
+    """Pipeline implementation behind process_query_async.
+
+    All status output goes through ``echo`` into the caller-owned
+    ``out`` buffer, keeping concurrent pipelines' output separate.
+    """
+    echo = functools.partial(print, file=out)
+    echo(f"\n{'='*60}")
+    echo(f"USER QUERY: {user_query}")
+    echo(f"{'='*60}")
+    echo()
+
+    # Compound questions fan out into parallel sub-pipelines, each with
+    # a tighter prompt and a smaller BigQuery scan, merged at the end
+    if decompose and _COMPOUND_RE.search(user_query):
+        try:
+            sub_questions = await run_agent(_get_decomposer(), user_query)
+        except Exception as e:
+            echo(f"WARNING: Query decomposition failed: {e}")
+            sub_questions = [user_query]
+        if len(sub_questions) > 1:
+            echo(f"DECOMPOSED: {len(sub_questions)} sub-questions: {sub_questions}")
+            answers = await asyncio.gather(
+                *(process_query_async(q, client, decompose=False) for q in sub_questions)
+            )
+            merged = {
+                "results": [
+                    {"sub_question": question, "answer": answer if answer else "failed"}
+                    for question, answer in zip(sub_questions, answers)
+                ]
+            }
+            final_answer = await run_agent(
+                _get_answer_agent(), user_query, "(decomposed into sub-queries)", merged
+            )
+            echo("COMBINED NATURAL LANGUAGE ANSWER:")
+            echo(final_answer.answer)
+            return final_answer.answer
 
     try:
         # Step 1: Get schema context from MCP
-        print("=" * 60)
-        print("STEP 1: SCHEMA DISCOVERY")
-        print("=" * 60)
-        print("Getting schema context from MCP server...")
+        echo("=" * 60)
+        echo("STEP 1: SCHEMA DISCOVERY")
+        echo("=" * 60)
+        echo("Getting schema context from MCP server...")
         schema_context = await client.get_schema_context()
-        print(f"SUCCESS: Schema context retrieved ({len(schema_context)} chars)")
-        print()
+        echo(f"SUCCESS: Schema context retrieved ({len(schema_context)} chars)")
+        echo()
         
-        # Extract table names from schema context (simple parsing)
-        print("Parsing available tables from schema...")
-        lines = schema_context.split('\n')
-        available_tables = []
-        for line in lines:
-            if line.strip() and line.strip().endswith(':') and not line.startswith(' '):
-                table_name = line.strip().rstrip(':').lower()
-                if table_name not in ['database schema and context', 'tables', 'columns']:
-                    available_tables.append(table_name)
-        
-        print(f"TABLES: Available tables: {available_tables}")
-        print()
+        # Extract table names from schema context in one pass
+        echo("Parsing available tables from schema...")
+        available_tables = [
+            header for line in schema_context.splitlines()
+            if (m := _HEADER_RE.match(line)) and (header := m.group(1).lower()) not in _SKIP_HEADERS
+        ]
+
+        echo(f"TABLES: Available tables: {available_tables}")
+        echo()
 
         # Step 2: Select relevant tables
-        print("=" * 60)
-        print("STEP 2: TABLE SELECTION")
-        print("=" * 60)
-        selector = TableSelector(available_tables)
-        selected_tables = selector(user_query)
-        print("SELECTED: Relevant tables:", selected_tables)
-        print()
+        echo("=" * 60)
+        echo("STEP 2: TABLE SELECTION")
+        echo("=" * 60)
+        # Cheap keyword pass first: confident lexical matches skip the
+        # LLM call entirely, otherwise the LLM sees a narrowed candidate
+        # list instead of every table
+        preselected, candidates = preselect(user_query, available_tables)
+        nl2sql, answer_agent = _get_nl2sql_agent(), _get_answer_agent()
+        if preselected:
+            selected_tables = preselected
+            echo("SELECTED: Relevant tables (keyword match):", selected_tables)
+        else:
+            # Selector cached per schema; the narrowed candidate list
+            # only shapes this call's prompt
+            selector = _get_selector(available_tables)
+            selected_tables = await run_agent(selector, user_query, candidates or None)
+            echo("SELECTED: Relevant tables:", selected_tables)
+        echo()
 
         # Step 3: Generate reasoning + SQL
-        print("=" * 60)
-        print("STEP 3: SQL GENERATION WITH AI REASONING")
-        print("=" * 60)
-        nl2sql = NL2SQLAgent()
-        reasoning_sql = nl2sql(user_query, {"schema_context": schema_context, "tables": selected_tables})
-        print("REASONING:")
-        print(reasoning_sql.reasoning)
-        print()
-        print("RAW SQL GENERATED:")
-        print(reasoning_sql.sql)
-        print()
+        echo("=" * 60)
+        echo("STEP 3: SQL GENERATION WITH AI REASONING")
+        echo("=" * 60)
+        reasoning_sql = await run_agent(nl2sql, user_query, {"schema_context": schema_context, "tables": selected_tables})
+        echo("REASONING:")
+        echo(reasoning_sql.reasoning)
+        echo()
+        echo("RAW SQL GENERATED:")
+        echo(reasoning_sql.sql)
+        echo()
 
         # Step 4: Clean the SQL by removing markdown formatting
-        print("=" * 60)
-        print("STEP 4: SQL CLEANUP")
-        print("=" * 60)
-        clean_sql = clean_sql_from_markdown(reasoning_sql.sql)
-        print("FINAL SQL FOR EXECUTION:")
-        print(clean_sql)
-        print()
+        echo("=" * 60)
+        echo("STEP 4: SQL CLEANUP")
+        echo("=" * 60)
+        clean_sql = clean_sql_from_markdown(reasoning_sql.sql, out=out)
+        echo("FINAL SQL FOR EXECUTION:")
+        echo(clean_sql)
+        echo()
 
         # Step 5: Execute SQL via MCP
-        print("=" * 60)
-        print("STEP 5: BIGQUERY EXECUTION")
-        print("=" * 60)
-        print("Executing query via MCP...")
+        echo("=" * 60)
+        echo("STEP 5: BIGQUERY EXECUTION")
+        echo("=" * 60)
+        echo("Executing query via MCP...")
         try:
             results = await client.query_bigquery(clean_sql)
-            print("SUCCESS: Query executed successfully!")
-            print()
-            print("QUERY RESULTS:")
-            print(results)
+            echo("SUCCESS: Query executed successfully!")
+            echo()
+            echo("QUERY RESULTS:")
+            rows = results.get("results", []) if isinstance(results, dict) else []
+            if rows:
+                # One vectorized pandas render instead of a Python-level
+                # loop over every row - matters for large result sets
+                df = pd.DataFrame(rows)
+                echo(f"ROWS: {len(df)}")
+                echo(df.head(10).to_string(index=False))
+                if len(df) > 10:
+                    echo(f"... and {len(df) - 10} more rows")
+            else:
+                echo(results)
         except Exception as e:
-            print(f"ERROR: Query execution failed: {e}")
-            print()
+            echo(f"ERROR: Query execution failed: {e}")
+            echo()
             # Create mock results for demonstration
             results = {
                 "results": [
@@ -149,23 +325,22 @@ async def process_query_async(user_query: str, client: MCPClient):
             }
 
         # Step 6: Generate natural language answer
-        print()
-        print("=" * 60)
-        print("STEP 6: AI ANSWER GENERATION")
-        print("=" * 60)
-        answer_agent = AnswerAgent()
-        final_answer = answer_agent(user_query, clean_sql, results)
-        print("NATURAL LANGUAGE ANSWER:")
-        print(final_answer.answer)
-        print()
-        print("=" * 60)
-        print("PROCESS COMPLETED SUCCESSFULLY!")
-        print("=" * 60)
-        
-        return True
+        echo()
+        echo("=" * 60)
+        echo("STEP 6: AI ANSWER GENERATION")
+        echo("=" * 60)
+        final_answer = await run_agent(answer_agent, user_query, clean_sql, results)
+        echo("NATURAL LANGUAGE ANSWER:")
+        echo(final_answer.answer)
+        echo()
+        echo("=" * 60)
+        echo("PROCESS COMPLETED SUCCESSFULLY!")
+        echo("=" * 60)
+
+        return final_answer.answer
         
     except Exception as e:
-        print(f"ERROR: Processing query failed: {e}")
+        echo(f"ERROR: Processing query failed: {e}")
         return False
 
 async def interactive_mode():
@@ -177,10 +352,9 @@ async def interactive_mode():
         print("\nERROR: OpenAI API key not configured. Please check your .env file.")
         return
     
-    # Configure DSPy with OpenAI
-    model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-    print(f"CONFIGURING: DSPy with model: {model}")
-    dspy.configure(lm=dspy.LM(model=model))
+    # Configure DSPy with OpenAI (shared LM, built once per process)
+    lm = _ensure_dspy()
+    print(f"CONFIGURING: DSPy with model: {lm.model}")
 
     print("\n" + "="*60)
     print("READY: Interactive NLP-to-SQL Agent!")
@@ -198,10 +372,15 @@ async def interactive_mode():
     async with MCPClient("http://localhost:8000") as client:
         print("CONNECTED: MCP server")
         
-        # Test connection
+        # Test connection and warm the schema cache in parallel - the
+        # two requests are independent, so the wait is max() not sum()
         try:
-            health = await client.health_check()
+            health, _ = await asyncio.gather(
+                client.health_check(),
+                client.get_schema_context()
+            )
             print(f"HEALTH: MCP server status: {health}")
+            print("WARMED: Schema context prefetched")
         except Exception as e:
             print(f"WARNING: MCP connection issue: {e}")
         
@@ -209,11 +388,24 @@ async def interactive_mode():
         print("="*60)
         print("READY FOR QUESTIONS! (Type 'quit' to exit)")
         print("="*60)
-        
+
+        # Async input keeps the event loop running while the user types,
+        # so background warm-up tasks can overlap with typing time
+        prompt_session = PromptSession() if PromptSession else None
+        background_tasks = set()
+
+        def _keep_schema_warm():
+            task = asyncio.create_task(client.get_schema_context())
+            background_tasks.add(task)
+            task.add_done_callback(background_tasks.discard)
+
         while True:
             try:
                 print()
-                user_input = input("ENTER YOUR QUESTION: ").strip()
+                if prompt_session:
+                    user_input = (await prompt_session.prompt_async("ENTER YOUR QUESTION: ")).strip()
+                else:
+                    user_input = (await asyncio.to_thread(input, "ENTER YOUR QUESTION: ")).strip()
                 
                 if user_input.lower() in ['quit', 'exit', 'q', 'bye']:
                     print()
@@ -224,10 +416,25 @@ async def interactive_mode():
                     print("WARNING: Please enter a question...")
                     continue
                 
+                # Serve repeats of an equivalent question from the cache
+                cached_answer = query_cache.get(user_input)
+                if cached_answer is not None:
+                    print()
+                    print("CACHED: Equivalent question answered recently")
+                    print("NATURAL LANGUAGE ANSWER:")
+                    print(cached_answer)
+                    print()
+                    print("Ready for next question...")
+                    continue
+
                 # Process the query
                 success = await process_query_async(user_input, client)
-                
+
                 if success:
+                    query_cache.put(user_input, success)
+                    # Refresh the schema TTL cache while the user reads
+                    # the answer and types the next question
+                    _keep_schema_warm()
                     print()
                     print("="*60)
                     print("QUERY PROCESSING COMPLETED!")
@@ -243,14 +450,22 @@ async def interactive_mode():
             except Exception as e:
                 print(f"\nERROR: Unexpected error: {e}")
 
+# Built once at import time; main() just prints it
+_MODE_MENU = "\n".join([
+    "NLP-to-SQL Agent with Real MCP Integration",
+    "=" * 50,
+    "Choose Mode:",
+    "1. Interactive Mode (ask your own questions)",
+    "2. Demo Mode (see example queries)",
+    "3. Single Test Query",
+])
+
 def main():
     """Main function to choose execution mode."""
-    print("NLP-to-SQL Agent with Real MCP Integration")
-    print("=" * 50)
-    print("Choose Mode:")
-    print("1. Interactive Mode (ask your own questions)")
-    print("2. Demo Mode (see example queries)")
-    print("3. Single Test Query")
+    # Emoji-heavy status output; avoid UnicodeEncodeError on narrow consoles
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+    print(_MODE_MENU)
     
     choice = input("\nEnter your choice (1/2/3): ").strip()
     
@@ -267,8 +482,7 @@ def main():
         
         # Configure DSPy first
         if check_openai_key():
-            model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-            dspy.configure(lm=dspy.LM(model=model))
+            _ensure_dspy()
             asyncio.run(test_single())
     else:
         print("Invalid choice. Running interactive mode...")
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Canonical-form cache for the NLP-to-SQL pipeline
+
+Equivalent questions ("top 5 customers by revenue" vs "Show me the top
+5 customers by revenue") normalize to the same canonical form, so a
+repeat skips the whole multi-LLM + BigQuery pipeline and returns the
+stored answer.
+"""
+
+import functools
+import re
+import string
+import time
+
+# Answers stay valid for this long (matches the schema cache scale)
+CACHE_TTL = 600.0
+
+_WS_RE = re.compile(r'\s+')
+_PUNCT_TBL = str.maketrans('', '', string.punctuation)
+
+# Filler words that don't change the meaning of a data question
+_STOPWORDS = frozenset({
+    'show', 'me', 'the', 'a', 'an', 'please', 'can', 'could', 'would',
+    'you', 'give', 'tell', 'us', 'of'
+})
+
+# {canonical_query: (timestamp, pipeline_result)}
+_results = {}
+
+
+@functools.lru_cache(maxsize=512)
+def canonicalize(query: str) -> str:
+    """Reduce a question to a canonical comparison form."""
+    text = query.lower().translate(_PUNCT_TBL)
+    words = [w for w in _WS_RE.split(text) if w and w not in _STOPWORDS]
+    return ' '.join(words)
+
+
+def get(query: str):
+    """Return the cached pipeline result for an equivalent query, or None."""
+    entry = _results.get(canonicalize(query))
+    if entry and time.monotonic() - entry[0] < CACHE_TTL:
+        return entry[1]
+    return None
+
+
+def put(query: str, result):
+    """Store a pipeline result under the query's canonical form."""
+    _results[canonicalize(query)] = (time.monotonic(), result)
+
+
+def clear():
+    """Drop all cached results."""
+    _results.clear()
+    canonicalize.cache_clear()
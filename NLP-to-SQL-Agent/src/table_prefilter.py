@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Keyword-based table preselector
+
+The DSPy TableSelector is an LLM call per question, but for many
+questions the relevant tables are obvious from lexical overlap with the
+table names ("orders last month" -> orders). This prefilter resolves
+the easy cases with zero LLM calls and narrows the candidate list for
+the hard ones.
+"""
+
+import re
+from typing import List, Tuple
+
+_TOKEN_RE = re.compile(r'[a-z]+')
+
+# Overlap ratio at which a keyword match is trusted without the LLM
+CONFIDENCE_THRESHOLD = 0.8
+
+
+def _tokens(text: str) -> set:
+    """Tokenize and naively stem plural-s."""
+    return {
+        token[:-1] if token.endswith('s') and len(token) > 3 else token
+        for token in _TOKEN_RE.findall(text.lower())
+    }
+
+
+def preselect(query: str, tables: List[str], top_k: int = 8) -> Tuple[List[str], List[str]]:
+    """Score tables by token overlap with the question.
+
+    Args:
+        query: The user's natural language question
+        tables: Available table names
+        top_k: Maximum candidates to return for the LLM fallback
+
+    Returns:
+        (selected, candidates): selected is non-empty only when the
+        keyword overlap is confident enough to skip the LLM entirely;
+        candidates is the top-K scored subset to narrow the LLM prompt,
+        or empty when no table overlaps the question at all - zero
+        lexical signal means no narrowing, and callers fall back to the
+        full table list.
+    """
+    query_tokens = _tokens(query)
+    if not query_tokens:
+        return [], []
+
+    scored = []
+    for table in tables:
+        table_tokens = _tokens(table)
+        if not table_tokens:
+            continue
+        overlap = len(query_tokens & table_tokens) / len(table_tokens)
+        if overlap > 0:
+            scored.append((overlap, table))
+
+    scored.sort(key=lambda pair: pair[0], reverse=True)
+    # Truncation only applies when scores exist; an arbitrary prefix of
+    # the table list could hide the relevant table from the LLM
+    candidates = [table for _, table in scored[:top_k]]
+
+    confident = [table for score, table in scored if score >= CONFIDENCE_THRESHOLD]
+    if confident and len(confident) <= 2:
+        return confident, candidates
+    return [], candidates
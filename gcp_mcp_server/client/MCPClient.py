@@ -8,6 +8,7 @@ Can be imported and used in other applications.
 
 import asyncio
 import aiohttp
+import itertools
 import json
 from typing import Dict, Any, Optional
 
@@ -15,17 +16,25 @@ from typing import Dict, Any, Optional
 class MCPClient:
     """Lean MCP client for FastMCP servers"""
     
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(self, base_url: str = "http://localhost:8000",
+                 session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize MCP client
-        
+
         Args:
             base_url: Base URL of the MCP server (default: http://localhost:8000)
+            session: Optional shared aiohttp session. When provided, the
+                client reuses its connection pool and does NOT close it on
+                disconnect - the caller owns its lifecycle.
         """
         self.base_url = base_url.rstrip('/')
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
         self.session_id: Optional[str] = None
         self.initialized = False
+        # id 1 is the initialize request; unique ids keep in-flight
+        # calls distinguishable
+        self._id_gen = itertools.count(2)
     
     async def __aenter__(self):
         """Async context manager entry"""
@@ -38,10 +47,12 @@ class MCPClient:
     
     async def connect(self):
         """Connect to MCP server and initialize session"""
-        if self.session:
+        if self.initialized:
             return
-        
-        self.session = aiohttp.ClientSession()
+
+        if self.session is None:
+            self.session = aiohttp.ClientSession()
+            self._owns_session = True
         
         # Initialize MCP session
         payload = {
@@ -74,7 +85,7 @@ class MCPClient:
     
     async def disconnect(self):
         """Disconnect from MCP server"""
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
             self.session = None
         self.session_id = None
@@ -121,7 +132,7 @@ class MCPClient:
         
         payload = {
             "jsonrpc": "2.0",
-            "id": 2,
+            "id": next(self._id_gen),
             "method": "tools/call",
             "params": {
                 "name": tool_name,
@@ -138,6 +149,11 @@ class MCPClient:
         try:
             async with self.session.post(f"{self.base_url}/mcp", json=payload, headers=headers) as response:
                 if response.status == 200:
+                    # Servers may answer single-shot calls with plain JSON
+                    # rather than SSE framing; skip the line scan then
+                    content_type = response.headers.get('Content-Type', '')
+                    if 'application/json' in content_type:
+                        return self._extract_tool_result(await response.json())
                     content = await response.text()
                     return self._parse_sse_response(content)
                 else:
@@ -146,6 +162,61 @@ class MCPClient:
         except Exception as e:
             raise Exception(f"Tool '{tool_name}' call failed: {e}")
     
+    async def batch_call_tool(self, calls) -> list:
+        """
+        Call several tools in a single JSON-RPC batch request
+
+        Args:
+            calls: List of (tool_name, arguments) tuples
+
+        Returns:
+            Results in the same order as calls; failed entries are
+            {"error": ...} dicts rather than raising, so one bad call
+            doesn't lose the rest of the batch.
+        """
+        if not self.initialized:
+            raise Exception("MCP client not connected. Use 'await client.connect()' or context manager.")
+
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "tools/call",
+                "params": {"name": name, "arguments": arguments or {}}
+            }
+            for i, (name, arguments) in enumerate(calls)
+        ]
+
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json, text/event-stream",
+            "mcp-session-id": self.session_id
+        }
+
+        async with self.session.post(f"{self.base_url}/mcp", json=payload, headers=headers) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"Batch call failed: HTTP {response.status} - {error_text}")
+            content = await response.text()
+
+        # Demultiplex responses by id - batch order isn't guaranteed
+        results = [{"error": "No response"} for _ in calls]
+        for line in content.strip().split('\n'):
+            if not line.startswith('data: '):
+                continue
+            try:
+                message = json.loads(line[6:])
+            except json.JSONDecodeError:
+                continue
+            for item in (message if isinstance(message, list) else [message]):
+                item_id = item.get("id")
+                if isinstance(item_id, int) and 0 <= item_id < len(calls):
+                    try:
+                        results[item_id] = self._extract_tool_result(item)
+                    except Exception as e:
+                        results[item_id] = {"error": str(e)}
+        return results
+
     def _parse_sse_response(self, content: str) -> Any:
         """Parse Server-Sent Events response"""
         lines = content.strip().split('\n')
@@ -154,24 +225,28 @@ class MCPClient:
                 data = line[6:]  # Remove 'data: ' prefix
                 try:
                     result = json.loads(data)
-                    if "result" in result:
-                        tool_result = result["result"]
-                        if "content" in tool_result and tool_result["content"]:
-                            first_content = tool_result["content"][0]
-                            if "text" in first_content:
-                                return first_content["text"]
-                            else:
-                                return first_content
-                        else:
-                            return tool_result
-                    elif "error" in result:
-                        raise Exception(f"Tool error: {result['error']}")
-                    else:
-                        return result
                 except json.JSONDecodeError:
                     continue
-        
+                return self._extract_tool_result(result)
+
         raise Exception("No valid response data found")
+
+    def _extract_tool_result(self, result: Dict[str, Any]) -> Any:
+        """Unwrap a JSON-RPC tool response message"""
+        if "result" in result:
+            tool_result = result["result"]
+            if "content" in tool_result and tool_result["content"]:
+                first_content = tool_result["content"][0]
+                if "text" in first_content:
+                    return first_content["text"]
+                else:
+                    return first_content
+            else:
+                return tool_result
+        elif "error" in result:
+            raise Exception(f"Tool error: {result['error']}")
+        else:
+            return result
     
     # Convenience methods for common tools
     async def health_check(self) -> dict:
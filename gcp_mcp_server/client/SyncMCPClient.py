@@ -6,7 +6,11 @@ Provides sync methods for easier integration with non-async code.
 """
 
 import asyncio
-from typing import Dict, Any
+import atexit
+import json
+import threading
+import time
+from typing import Dict, Any, Optional
 
 # Try relative import first, fall back to absolute
 try:
@@ -17,75 +21,102 @@ except ImportError:
 
 class SyncMCPClient:
     """Synchronous wrapper for MCPClient"""
-    
+
+    # Schema-shaped data changes on the scale of hours; cache reads
+    # briefly so repeated questions don't re-pay the network round trip
+    _TTL = 300.0
+
     def __init__(self, base_url: str = "http://localhost:8000"):
         """
         Initialize sync MCP client
-        
+
         Args:
             base_url: Base URL of the MCP server
         """
         self.base_url = base_url
-        self._loop = None
-    
+        # One persistent loop on a daemon thread + one persistent
+        # MCPClient: each sync call reuses the established HTTP session
+        # instead of paying a fresh TCP/TLS handshake and MCP initialize
+        # per invocation, and works whether or not the caller is already
+        # inside an event loop.
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
+        self._client: Optional[MCPClient] = None
+        self._schema_cache: Dict[tuple, tuple] = {}
+        atexit.register(self.close)
+
     def _run_async(self, coro):
-        """Run async coroutine in sync context"""
-        try:
-            # Try to get existing event loop
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If we're already in an async context, we need a new thread
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(asyncio.run, coro)
-                    return future.result()
-            else:
-                return loop.run_until_complete(coro)
-        except RuntimeError:
-            # No event loop, create new one
-            return asyncio.run(coro)
-    
-    async def _async_call_tool(self, tool_name: str, arguments: Dict[str, Any] = None):
-        """Async helper for tool calls"""
-        async with MCPClient(self.base_url) as client:
-            return await client.call_tool(tool_name, arguments)
-    
+        """Run async coroutine on this client's background loop"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _get_client(self) -> MCPClient:
+        """Lazily connect the persistent MCPClient on first use"""
+        if self._client is None:
+            client = MCPClient(self.base_url)
+            self._run_async(client.connect())
+            self._client = client
+        return self._client
+
+    def close(self):
+        """Disconnect the persistent client and release its connections"""
+        if self._client is not None and not self._loop.is_closed():
+            self._run_async(self._client.disconnect())
+        self._client = None
+
     def call_tool(self, tool_name: str, arguments: Dict[str, Any] = None) -> Any:
         """
         Call an MCP tool synchronously
-        
+
         Args:
             tool_name: Name of the tool to call
             arguments: Tool arguments (optional)
-            
+
         Returns:
             Tool response data
         """
-        return self._run_async(self._async_call_tool(tool_name, arguments))
-    
+        return self._run_async(self._get_client().call_tool(tool_name, arguments))
+
     def health_check(self) -> dict:
         """Check server health (synchronous)"""
-        async def _health():
-            async with MCPClient(self.base_url) as client:
-                return await client.health_check()
-        
-        return self._run_async(_health())
-    
+        return self._run_async(self._get_client().health_check())
+
+    def _cached(self, key: tuple, fetch):
+        """Return a TTL-cached value, calling fetch() on miss/expiry"""
+        entry = self._schema_cache.get(key)
+        if entry and time.monotonic() - entry[0] < self._TTL:
+            return entry[1]
+        value = fetch()
+        self._schema_cache[key] = (time.monotonic(), value)
+        return value
+
+    def invalidate_schema(self):
+        """Drop all cached schema data (manual cache busting)"""
+        self._schema_cache.clear()
+
     def get_schema_context(self) -> str:
-        """Get database schema context (synchronous)"""
-        async def _schema():
-            async with MCPClient(self.base_url) as client:
-                return await client.get_schema_context()
-        
-        return self._run_async(_schema())
-    
+        """Get database schema context (synchronous, TTL-cached)"""
+        return self._cached(
+            ('schema',),
+            lambda: self._run_async(self._get_client().get_schema_context())
+        )
+
+    def prepare_context_sync(self) -> dict:
+        """Get available tables and schema context in one MCP call (TTL-cached)
+
+        Returns:
+            Dict with 'tables' and 'schema_context' keys
+        """
+        def _fetch():
+            result = self._run_async(self._get_client().call_tool("prepare_context"))
+            # The tool returns its payload as JSON-encoded text
+            return json.loads(result) if isinstance(result, str) else result
+
+        return self._cached(('prepare_context',), _fetch)
+
     def query_bigquery(self, query: str) -> dict:
         """Execute BigQuery SQL query (synchronous)"""
-        async def _query():
-            async with MCPClient(self.base_url) as client:
-                return await client.query_bigquery(query)
-        
-        return self._run_async(_query())
+        return self._run_async(self._get_client().query_bigquery(query))
 
 
 # Example usage
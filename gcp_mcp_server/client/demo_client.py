@@ -4,6 +4,9 @@ Demo script showing how to use the lean MCPClient
 """
 
 import asyncio
+import json
+
+import aiohttp
 
 # Try relative import first, fall back to absolute
 try:
@@ -12,46 +15,52 @@ except ImportError:
     from MCPClient import MCPClient
 
 
-async def demo_basic_usage():
+async def demo_basic_usage(session=None):
     """Basic usage demonstration"""
     print("🔧 Basic MCPClient Usage Demo")
     print("-" * 40)
-    
-    async with MCPClient() as client:
+
+    async with MCPClient(session=session) as client:
         print("✅ Connected to MCP server")
         
+        # Health check and schema fetch are independent - run them
+        # concurrently on the shared session
+        health, schema = await asyncio.gather(
+            client.health_check(),
+            client.get_schema_context(),
+        )
+
         # 1. Health check
         print("\n1️⃣ Health Check:")
-        health = await client.health_check()
         print(f"   Status: {health['status']}")
-        
+
         # 2. Schema context
         print("\n2️⃣ Schema Context:")
-        schema = await client.get_schema_context()
-        lines = schema.split('\n')
+        # maxsplit stops after the preview lines instead of splitting
+        # the whole multi-KB schema string
+        preview = schema.split('\n', 5)[:5]
         print(f"   Retrieved {len(schema)} characters")
         print(f"   First few lines:")
-        for line in lines[:5]:
+        for line in preview:
             print(f"   {line}")
         
         # 3. BigQuery queries
         print("\n3️⃣ BigQuery Queries:")
-        
-        # Simple query
-        result1 = await client.query_bigquery("SELECT 'Hello' as greeting, 42 as answer")
+
+        result1, result2 = await asyncio.gather(
+            client.query_bigquery("SELECT 'Hello' as greeting, 42 as answer"),
+            client.query_bigquery("SELECT 10 + 5 as sum, 10 * 5 as product"),
+        )
         print(f"   Simple query result: {result1['results']}")
-        
-        # Math query
-        result2 = await client.query_bigquery("SELECT 10 + 5 as sum, 10 * 5 as product")
         print(f"   Math query result: {result2['results']}")
 
 
-async def demo_error_handling():
+async def demo_error_handling(session=None):
     """Error handling demonstration"""
     print("\n🛡️ Error Handling Demo")
     print("-" * 40)
-    
-    async with MCPClient() as client:
+
+    async with MCPClient(session=session) as client:
         # Test invalid query
         try:
             result = await client.query_bigquery("INVALID SQL QUERY")
@@ -67,32 +76,40 @@ async def demo_error_handling():
             print(f"✅ Caught expected error: {e}")
 
 
-async def demo_custom_queries():
+async def demo_custom_queries(session=None):
     """Custom query demonstrations"""
     print("\n📊 Custom Query Demo")
     print("-" * 40)
-    
-    async with MCPClient() as client:
+
+    async with MCPClient(session=session) as client:
         queries = [
             ("Current timestamp", "SELECT CURRENT_DATETIME() as now"),
             ("String operations", "SELECT UPPER('hello world') as uppercase, LENGTH('test') as length"),
             ("Array operations", "SELECT [1, 2, 3, 4, 5] as numbers"),
             ("JSON operations", "SELECT JSON_OBJECT('name', 'John', 'age', 30) as person")
         ]
-        
-        for description, query in queries:
-            try:
-                result = await client.query_bigquery(query)
+
+        # One batched POST instead of four sequential round trips
+        results = await client.batch_call_tool(
+            [("query_bigquery", {"query": query}) for _, query in queries]
+        )
+        for (description, _), result in zip(queries, results):
+            if isinstance(result, str):
+                result = json.loads(result)
+            if isinstance(result, dict) and "error" in result:
+                print(f"   {description}: Error - {result['error']}")
+            else:
                 print(f"   {description}: {result['results'][0]}")
-            except Exception as e:
-                print(f"   {description}: Error - {e}")
 
 
 async def main():
     """Run all demos"""
-    await demo_basic_usage()
-    await demo_error_handling()
-    await demo_custom_queries()
+    # One session (and TCP connection pool) for the whole run - each demo
+    # opening its own would pay a fresh socket setup per demo
+    async with aiohttp.ClientSession() as session:
+        await demo_basic_usage(session)
+        await demo_error_handling(session)
+        await demo_custom_queries(session)
     
     print("\n🎉 Demo complete!")
     print("\n💡 Usage in your code:")
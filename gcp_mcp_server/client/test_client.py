@@ -7,21 +7,70 @@ Uses direct HTTP requests to test the FastMCP server
 
 import asyncio
 import aiohttp
+import itertools
 import json
 import sys
 from typing import Dict, Any
 
+# orjson is 2-5x faster than stdlib json for the encode/decode this
+# harness does per request; fall back transparently when not installed
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    _json_loads = json.loads
+
+# Static payloads serialized once at import
+_INIT_PAYLOAD = _json_dumps({
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {"tools": {}},
+        "clientInfo": {"name": "test-client", "version": "1.0.0"}
+    }
+})
+_INITIALIZED_PAYLOAD = _json_dumps({
+    "jsonrpc": "2.0",
+    "method": "notifications/initialized"
+})
+
 
 class FastMCPTestClient:
     """Simple test client for FastMCP server"""
-    
+
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url.rstrip('/')
         self.session = None
         self.session_id = None
+        self._call_headers = None
+        # id 1 is the initialize request; unique ids let concurrent
+        # calls be matched to their responses
+        self._id_gen = itertools.count(2)
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        # Explicit connector: default keepalive (15s) drops pooled
+        # connections between intermittent tool calls, forcing fresh
+        # TCP handshakes mid-suite
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=32,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True,
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json, text/event-stream"
+            },
+        )
         await self.initialize()
         return self
     
@@ -31,26 +80,11 @@ class FastMCPTestClient:
     
     async def initialize(self):
         """Initialize MCP session"""
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {"tools": {}},
-                "clientInfo": {"name": "test-client", "version": "1.0.0"}
-            }
-        }
-        
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json, text/event-stream"
-        }
-        
         try:
-            async with self.session.post(f"{self.base_url}/mcp", json=payload, headers=headers) as response:
+            async with self.session.post(f"{self.base_url}/mcp", data=_INIT_PAYLOAD) as response:
                 if response.status == 200:
                     self.session_id = response.headers.get('mcp-session-id')
+                    self._call_headers = {"mcp-session-id": self.session_id}
                     print(f"✅ MCP session initialized. Session ID: {self.session_id}")
                     await self.send_initialized()
                     return True
@@ -63,19 +97,9 @@ class FastMCPTestClient:
     
     async def send_initialized(self):
         """Send initialized notification to complete the handshake"""
-        payload = {
-            "jsonrpc": "2.0",
-            "method": "notifications/initialized"
-        }
-        
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json, text/event-stream",
-            "mcp-session-id": self.session_id
-        }
-        
         try:
-            async with self.session.post(f"{self.base_url}/mcp", json=payload, headers=headers) as response:
+            async with self.session.post(f"{self.base_url}/mcp", data=_INITIALIZED_PAYLOAD,
+                                         headers=self._call_headers) as response:
                 pass  # Notification doesn't require response handling
         except Exception as e:
             print(f"⚠️ Error sending initialized: {e}")
@@ -85,32 +109,32 @@ class FastMCPTestClient:
         if not self.session_id:
             return {"error": "No session ID"}
         
-        payload = {
+        req_id = next(self._id_gen)
+        payload = _json_dumps({
             "jsonrpc": "2.0",
-            "id": 2,
+            "id": req_id,
             "method": "tools/call",
             "params": {
                 "name": tool_name,
                 "arguments": arguments or {}
             }
-        }
-        
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json, text/event-stream",
-            "mcp-session-id": self.session_id
-        }
-        
+        })
+
         try:
-            async with self.session.post(f"{self.base_url}/mcp", json=payload, headers=headers) as response:
+            async with self.session.post(f"{self.base_url}/mcp", data=payload,
+                                         headers=self._call_headers) as response:
                 if response.status == 200:
-                    content = await response.text()
-                    lines = content.strip().split('\n')
-                    for line in lines:
+                    # Stream the SSE body line by line and return on the
+                    # first usable frame instead of buffering the whole
+                    # response and splitting it
+                    async for raw in response.content:
+                        line = raw.decode('utf-8', 'ignore').rstrip()
                         if line.startswith('data: '):
                             data = line[6:]
                             try:
-                                result = json.loads(data)
+                                result = _json_loads(data)
+                                if result.get("id", req_id) != req_id:
+                                    continue
                                 if "result" in result:
                                     tool_result = result["result"]
                                     if "content" in tool_result and tool_result["content"]:
@@ -125,7 +149,7 @@ class FastMCPTestClient:
                                     return {"error": result["error"]}
                                 else:
                                     return result
-                            except json.JSONDecodeError:
+                            except ValueError:
                                 continue
                     return {"error": "No valid data found"}
                 else:
@@ -140,35 +164,40 @@ async def test_tools():
     print("=" * 50)
     
     async with FastMCPTestClient() as client:
+        # The three tests are independent - fan them out so the suite
+        # takes max(call) instead of sum(call) on the warm session
+        test_query = "SELECT 1 as test_column, 'Hello World' as message"
+        health_response, schema_response, query_response = await asyncio.gather(
+            client.call_tool("health_check"),
+            client.call_tool("schema_context"),
+            client.call_tool("query_bigquery", {"query": test_query}),
+        )
+
         # Test 1: Health Check
         print("\n🧪 Testing Health Check...")
-        response = await client.call_tool("health_check")
-        if isinstance(response, dict) and "error" in response:
-            print(f"❌ Health Check Failed: {response['error']}")
+        if isinstance(health_response, dict) and "error" in health_response:
+            print(f"❌ Health Check Failed: {health_response['error']}")
         else:
-            print(f"✅ Health Check Success: {response}")
-        
-        # Test 2: Schema Context  
+            print(f"✅ Health Check Success: {health_response}")
+
+        # Test 2: Schema Context
         print("\n📊 Testing Schema Context...")
-        response = await client.call_tool("schema_context")
-        if isinstance(response, dict) and "error" in response:
-            print(f"❌ Schema Context Failed: {response['error']}")
+        if isinstance(schema_response, dict) and "error" in schema_response:
+            print(f"❌ Schema Context Failed: {schema_response['error']}")
         else:
-            response_str = str(response)
+            response_str = str(schema_response)
             if len(response_str) > 300:
                 print(f"✅ Schema Context Success ({len(response_str)} chars):")
                 print(f"Preview: {response_str[:300]}...")
             else:
-                print(f"✅ Schema Context Success: {response}")
-        
+                print(f"✅ Schema Context Success: {schema_response}")
+
         # Test 3: Simple BigQuery Query
         print("\n📈 Testing BigQuery Query...")
-        test_query = "SELECT 1 as test_column, 'Hello World' as message"
-        response = await client.call_tool("query_bigquery", {"query": test_query})
-        if isinstance(response, dict) and "error" in response:
-            print(f"❌ BigQuery Test Failed: {response['error']}")
+        if isinstance(query_response, dict) and "error" in query_response:
+            print(f"❌ BigQuery Test Failed: {query_response['error']}")
         else:
-            print(f"✅ BigQuery Test Success: {response}")
+            print(f"✅ BigQuery Test Success: {query_response}")
         
         print("\n" + "=" * 50)
         print("🏁 Testing Complete!")
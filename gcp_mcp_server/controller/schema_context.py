@@ -1,13 +1,74 @@
 import os
 import json
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from google.cloud import storage
+from google.cloud.exceptions import NotFound
+
+# orjson parses bytes natively and is ~3x faster than stdlib json on
+# the multi-KB context file; stdlib accepts bytes too, so the fallback
+# keeps the loaders byte-oriented either way
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Global variables to store GCS configuration
 gcs_bucket_path = None
 gcs_client = None
 
+# Parsed database_context.json cached per source, keyed by a version
+# stamp (local file mtime / GCS blob generation) so edits are picked up
+# without re-reading and re-parsing on every call.
+_kb_cache: Dict[str, Tuple[Any, Dict[str, Any]]] = {}
+
+# The schema context is a pure function of database_context.json, which
+# only changes between deployments - cache the built string per source
+# (local vs GCS bucket) instead of re-reading and re-concatenating on
+# every tool call.
+SCHEMA_CONTEXT_TTL = int(os.getenv("SCHEMA_TTL", "300"))  # seconds
+_ctx_cache: Dict[str, Tuple[float, str]] = {}
+_ctx_lock = threading.Lock()
+# Serializes cache-miss rebuilds: the first caller does the (possibly
+# GCS-backed) load, concurrent callers wait and hit the fresh cache
+_build_lock = threading.Lock()
+
+def invalidate_schema_context():
+    """Flush the cached schema context (e.g. after reconfiguring GCS)."""
+    with _ctx_lock:
+        _ctx_cache.clear()
+
+def refresh_schema_context() -> str:
+    """Rebuild the schema context eagerly and store it in the cache.
+
+    Called at server startup (and after reconfiguring GCS) so the first
+    tool call doesn't pay the knowledge-base read; the hot path then
+    never builds the string at all.
+    """
+    key = gcs_bucket_path or "local"
+    context_str = _build_schema_context()
+    with _ctx_lock:
+        _ctx_cache[key] = (time.monotonic(), context_str)
+    return context_str
+
+def _widen_http_pool(client, pool_size: int = 32):
+    """Raise the GCS transport's connection pool above the requests default.
+
+    The default pool of 10 connections saturates when many schema
+    requests race; a wider pool keeps them on reused keep-alive
+    connections. Best-effort - the transport attribute is private.
+    """
+    try:
+        import requests.adapters
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, pool_block=False)
+        client._http.mount('https://', adapter)
+    except Exception:
+        pass
+
 def initialize_gcs_config(bucket_path: Optional[str] = None):
     """Initialize GCS configuration if bucket path is provided."""
     global gcs_bucket_path, gcs_client
@@ -15,9 +76,14 @@ def initialize_gcs_config(bucket_path: Optional[str] = None):
         gcs_bucket_path = bucket_path
         try:
             gcs_client = storage.Client()
+            _widen_http_pool(gcs_client)
         except Exception as e:
             print(f"Error initializing GCS client for knowledge base: {e}")
             gcs_client = None
+        # Bucket changed; drop the old source's context and build the
+        # new one now rather than on the first request
+        invalidate_schema_context()
+        refresh_schema_context()
 
 # Default database context (fallback)
 default_database_context = {
@@ -82,11 +148,32 @@ def load_knowledge_base_from_local(knowledge_base_dir: str = "knowledge_base") -
         # Load unified database context file
         context_file = kb_path / "database_context.json"
         if context_file.exists():
-            with open(context_file, 'r') as f:
-                return json.load(f)
-        else:
-            print(f"Database context file not found: {context_file}")
-            return default_database_context
+            # Serve the parsed dict from cache unless the file changed
+            cache_key = f"local:{context_file}"
+            mtime = context_file.stat().st_mtime_ns
+            cached = _kb_cache.get(cache_key)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            with open(context_file, 'rb') as f:
+                context = _json_loads(f.read())
+            _kb_cache[cache_key] = (mtime, context)
+            return context
+        # Older knowledge bases shipped the schema and sample queries as
+        # separate files; fold them into the unified shape so every
+        # caller goes through the same builder and caches
+        schema_file = kb_path / "schema.json"
+        if schema_file.exists():
+            with open(schema_file, 'rb') as f:
+                tables = _json_loads(f.read())
+            queries_file = kb_path / "sample_queries.json"
+            sample_queries = {}
+            if queries_file.exists():
+                with open(queries_file, 'rb') as f:
+                    sample_queries = _json_loads(f.read())
+            return {"tables": tables, "sample_queries": sample_queries}
+
+        print(f"Database context file not found: {context_file}")
+        return default_database_context
             
     except Exception as e:
         print(f"Error loading local database base: {e}")
@@ -111,82 +198,143 @@ def load_knowledge_base_from_gcs() -> Dict[str, Any]:
         context_blob_name = f"{prefix}/database_context.json" if prefix else "database_context.json"
         context_blob = bucket.blob(context_blob_name)
 
-        if context_blob.exists():
-            context_content = context_blob.download_as_text()
-            return json.loads(context_content)
-        else:
+        # One metadata fetch learns the generation and doubles as the
+        # existence check - no separate blob.exists() round trip
+        try:
+            context_blob.reload()
+        except NotFound:
             print(f"Database context file not found in GCS: {context_blob_name}")
             return default_database_context
 
+        cache_key = f"gcs:{bucket_name}/{context_blob_name}"
+        cached = _kb_cache.get(cache_key)
+        if cached and cached[0] == context_blob.generation:
+            return cached[1]
+        context = _json_loads(context_blob.download_as_bytes())
+        _kb_cache[cache_key] = (context_blob.generation, context)
+        return context
+
     except Exception as e:
         print(f"Error loading knowledge base from GCS: {e}")
         return default_database_context
     
-def get_schema_context():
-    """Get comprehensive database context including schema, sample data, and queries."""
-    # Load from GCS if configured, otherwise load from local
+def _load_database_context() -> Dict[str, Any]:
+    """Load the database context from GCS if configured, else local."""
     if gcs_bucket_path and gcs_client:
         print(f"Loading database context from GCS bucket: {gcs_bucket_path}")
-        db_context = load_knowledge_base_from_gcs()
-    else:
-        print("Loading database context from local directory")
-        db_context = load_knowledge_base_from_local()
+        return load_knowledge_base_from_gcs()
+    print("Loading database context from local directory")
+    return load_knowledge_base_from_local()
+
+def get_table_names():
+    """Get the list of available table names from the database context."""
+    db_context = _load_database_context()
+    return [
+        table_info.get("full_table_name", table_name)
+        for table_name, table_info in db_context.get("tables", {}).items()
+    ]
+
+def get_schema_context():
+    """Get comprehensive database context including schema, sample data, and queries.
+
+    The built string is cached with a TTL keyed on the configured source,
+    so the hot path is a dict lookup rather than a disk/GCS read plus
+    string building per call.
+    """
+    key = gcs_bucket_path or "local"
+    now = time.monotonic()
+    with _ctx_lock:
+        cached = _ctx_cache.get(key)
+        if cached and now - cached[0] < SCHEMA_CONTEXT_TTL:
+            return cached[1]
+
+    # Single-flight: one loader per miss, everyone else rides its result
+    with _build_lock:
+        with _ctx_lock:
+            cached = _ctx_cache.get(key)
+            if cached and time.monotonic() - cached[0] < SCHEMA_CONTEXT_TTL:
+                return cached[1]
+
+        context_str = _build_schema_context()
+
+        with _ctx_lock:
+            _ctx_cache[key] = (time.monotonic(), context_str)
+    return context_str
+
+def _build_schema_context():
+    """Build the schema context string from the database context.
+
+    Collects fragments in a list and joins once at the end - repeated
+    string += reallocates and copies the whole context per line, which
+    gets quadratic as the knowledge base grows.
+    """
+    db_context = _load_database_context()
+
+    # The rendered text is attached to the parsed dict, which _kb_cache
+    # keeps until the underlying file changes - so the per-table
+    # upper()/repr() formatting below runs once per knowledge-base
+    # version, not once per TTL expiry
+    rendered = db_context.get("_rendered_context")
+    if rendered is not None:
+        return rendered
+
+    tables = db_context.get("tables", {})
+
+    parts = ["DATABASE SCHEMA CONTEXT:\n\n"]
 
-    # Generate comprehensive context string
-    context_str = "DATABASE SCHEMA CONTEXT:\n\n"
-    
     # Add table mapping section
-    context_str += "TABLE MAPPING (Short Name -> Full BigQuery Table Name):\n"
-    for table_name, table_info in db_context.get("tables", {}).items():
+    parts.append("TABLE MAPPING (Short Name -> Full BigQuery Table Name):\n")
+    for table_name, table_info in tables.items():
         full_name = table_info.get("full_table_name", table_name)
         if full_name != table_name:
-            context_str += f"  {table_name} -> {full_name}\n"
-    context_str += "\n"
-    
-    context_str += "IMPORTANT: Always use the full BigQuery table names in your SQL queries!\n\n"
-    
+            parts.append(f"  {table_name} -> {full_name}\n")
+    parts.append("\n")
+
+    parts.append("IMPORTANT: Always use the full BigQuery table names in your SQL queries!\n\n")
+
     # Tables section
-    context_str += "TABLES:\n"
-    for table_name, table_info in db_context.get("tables", {}).items():
+    parts.append("TABLES:\n")
+    for table_name, table_info in tables.items():
         # Use full table name if available, otherwise use simple table name
         display_name = table_info.get("full_table_name", table_name)
-        context_str += f"\n{display_name.upper()}:\n"
-        context_str += f"  Table Name: {display_name}\n"
-        context_str += "  Columns:\n"
-        
+        parts.append(f"\n{display_name.upper()}:\n")
+        parts.append(f"  Table Name: {display_name}\n")
+        parts.append("  Columns:\n")
+
         for col in table_info.get("columns", []):
             if isinstance(col, dict):
                 desc = f" - {col.get('description', '')}" if col.get('description') else ""
-                context_str += f"    - {col['name']} ({col.get('type', 'UNKNOWN')}){desc}\n"
+                parts.append(f"    - {col['name']} ({col.get('type', 'UNKNOWN')}){desc}\n")
             else:
-                context_str += f"    - {col}\n"
-        
+                parts.append(f"    - {col}\n")
+
         # Relationships
         if table_info.get("relationships"):
-            context_str += "  Relationships:\n"
+            parts.append("  Relationships:\n")
             for rel_table, rel_info in table_info["relationships"].items():
                 # Try to get full table name for relationship target
-                rel_table_info = db_context.get("tables", {}).get(rel_table, {})
-                rel_full_name = rel_table_info.get("full_table_name", rel_table)
-                context_str += f"    - {display_name}.{rel_info['local_key']} = {rel_full_name}.{rel_info['foreign_key']}\n"
-        
+                rel_full_name = tables.get(rel_table, {}).get("full_table_name", rel_table)
+                parts.append(f"    - {display_name}.{rel_info['local_key']} = {rel_full_name}.{rel_info['foreign_key']}\n")
+
         # Sample data
         if table_info.get("sample_data"):
-            context_str += "  Sample Data:\n"
+            parts.append("  Sample Data:\n")
             for i, row in enumerate(table_info["sample_data"][:3]):  # Show max 3 rows
-                context_str += f"    Row {i+1}: {row}\n"
-    
+                parts.append(f"    Row {i+1}: {row}\n")
+
     # Sample queries section
-    context_str += "\nSAMPLE QUERIES:\n"
+    parts.append("\nSAMPLE QUERIES:\n")
     for query_name, query_info in db_context.get("sample_queries", {}).items():
         if isinstance(query_info, dict):
             desc = query_info.get("description", "")
             sql = query_info.get("sql", "")
-            context_str += f"\n{query_name.upper()}:\n"
+            parts.append(f"\n{query_name.upper()}:\n")
             if desc:
-                context_str += f"  Description: {desc}\n"
-            context_str += f"  SQL: {sql}\n"
+                parts.append(f"  Description: {desc}\n")
+            parts.append(f"  SQL: {sql}\n")
         else:
-            context_str += f"{query_name}: {query_info}\n"
-    
-    return context_str
\ No newline at end of file
+            parts.append(f"{query_name}: {query_info}\n")
+
+    rendered = "".join(parts)
+    db_context["_rendered_context"] = rendered
+    return rendered
\ No newline at end of file
@@ -3,15 +3,68 @@
 FastMCP Test Client for BigQuery MCP Server
 
 This client connects to the FastMCP server using the correct protocol.
+
+The module is fully type-annotated so it can optionally be AOT-compiled
+for heavy use (e.g. `mypyc fastmcp_test_client.py`); the plain .py file
+remains the source of truth and works unchanged.
 """
 
 import asyncio
 import aiohttp
 import json
 import sys
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, List, Optional
 import argparse
-from datetime import datetime
+from datetime import datetime, timedelta
+
+# orjson encodes/decodes in C and handles every tool call and SSE frame
+# here; fall back to stdlib json when it isn't installed
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _json_pretty(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    _json_loads = orjson.loads
+    # orjson accepts any buffer-protocol object, enabling zero-copy
+    # parsing of memoryview slices
+    _JSON_LOADS_ACCEPTS_BUFFER = True
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def _json_pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+    _json_loads = json.loads
+    _JSON_LOADS_ACCEPTS_BUFFER = False
+
+def _find_session_id(obj: Any) -> Optional[str]:
+    """Pull a sessionId out of a parsed JSON-RPC response.
+
+    Checks the documented location first, then falls back to a
+    recursive walk - the parsed dict is inspected directly instead of
+    re-serializing it and regexing the string.
+    """
+    if isinstance(obj, dict):
+        session_id = obj.get("result", {}).get("sessionId") if isinstance(obj.get("result"), dict) else None
+        if session_id:
+            return session_id
+        for key, value in obj.items():
+            if key == "sessionId" and isinstance(value, str):
+                return value
+            found = _find_session_id(value)
+            if found:
+                return found
+    elif isinstance(obj, list):
+        for item in obj:
+            found = _find_session_id(item)
+            if found:
+                return found
+    return None
+
 
 class FastMCPClient:
     """Client for connecting to FastMCP server via SSE"""
@@ -20,107 +73,137 @@ class FastMCPClient:
         self.base_url = base_url.rstrip('/')
         self.session: Optional[aiohttp.ClientSession] = None
         self.session_id: Optional[str] = None
-    
-    async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        # Built once after initialize; reused by every later call
+        self._session_headers: Optional[Dict[str, str]] = None
+        # Constant request bodies, encoded once per instance
+        self._init_body = _json_dumps({
+            "jsonrpc": "2.0",
+            "id": "1",
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {
+                    "tools": {}
+                },
+                "clientInfo": {
+                    "name": "test-client",
+                    "version": "1.0.0"
+                }
+            }
+        })
+        self._list_tools_body = _json_dumps({
+            "jsonrpc": "2.0",
+            "id": "2",
+            "method": "tools/list"
+        })
+
+    async def __aenter__(self) -> "FastMCPClient":
+        # One tuned connector for the whole client lifetime so every
+        # /mcp POST reuses the same kept-alive connection instead of
+        # re-running the TCP handshake per call
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=16,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True,
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json, text/event-stream"
+            },
+        )
         return self
     
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         if self.session:
             await self.session.close()
+
+    @staticmethod
+    async def _read_sse_json(response: aiohttp.ClientResponse) -> Optional[Dict[str, Any]]:
+        """Return the first JSON payload from an SSE response.
+
+        Reads one whole blank-line-delimited SSE event per framing call
+        instead of buffering line by line, then scans its raw bytes -
+        the 'data: ' prefix check and slice happen before any decode,
+        and the payload bytes feed the JSON parser directly. Returns as
+        soon as a frame parses; the rest of the stream is not drained.
+        """
+        content = response.content
+        while True:
+            try:
+                event = await content.readuntil(b"\n\n")
+            except asyncio.IncompleteReadError as e:
+                event = e.partial
+            if not event:
+                return None
+            # Scan the event bytes in place rather than split()-ing into
+            # per-line objects; with orjson the payload is handed over
+            # as a zero-copy memoryview slice
+            idx = event.find(b'data: ')
+            while idx != -1:
+                end = event.find(b'\n', idx)
+                if end == -1:
+                    end = len(event)
+                if idx != 0 and event[idx - 1:idx] != b'\n':
+                    # Not at line start - matched inside a payload
+                    idx = event.find(b'data: ', end)
+                    continue
+                payload_end = end - 1 if event[end - 1:end] == b'\r' else end
+                if _JSON_LOADS_ACCEPTS_BUFFER:
+                    payload = memoryview(event)[idx + 6:payload_end]
+                else:
+                    payload = event[idx + 6:payload_end]
+                try:
+                    return _json_loads(payload)
+                except ValueError:
+                    pass
+                idx = event.find(b'data: ', end)
+            if not event.endswith(b"\n\n"):
+                # Partial tail at EOF with no parseable frame
+                return None
+
+    async def _post_mcp(self, payload: Any) -> Optional[Dict[str, Any]]:
+        """POST a JSON-RPC payload to /mcp and return the parsed response.
+
+        Accepts a dict or pre-encoded bytes; shares the serialized-body,
+        cached-headers and SSE-read logic across
+        initialize/list_tools/call_tool.
+        """
+        body = payload if isinstance(payload, bytes) else _json_dumps(payload)
+        async with self.session.post(
+            f"{self.base_url}/mcp",
+            data=body,
+            headers=self._session_headers
+        ) as response:
+            if response.status == 200:
+                return await self._read_sse_json(response)
+            return {"error": f"HTTP {response.status}: {await response.text()}"}
     
     async def initialize(self) -> Dict[str, Any]:
         """Initialize MCP session"""
         try:
-            payload = {
-                "jsonrpc": "2.0",
-                "id": "1",
-                "method": "initialize",
-                "params": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {
-                        "tools": {}
-                    },
-                    "clientInfo": {
-                        "name": "test-client",
-                        "version": "1.0.0"
-                    }
-                }
-            }
-            
-            headers = {
-                "Content-Type": "application/json",
-                "Accept": "application/json, text/event-stream"
-            }
-            
-            async with self.session.post(
-                f"{self.base_url}/mcp",
-                json=payload,
-                headers=headers
-            ) as response:
-                if response.status == 200:
-                    # Read SSE response
-                    async for line in response.content:
-                        line = line.decode().strip()
-                        if line.startswith('data: '):
-                            data = line[6:]  # Remove 'data: ' prefix
-                            try:
-                                result = json.loads(data)
-                                # Extract session ID from response
-                                if "sessionId" in str(result):
-                                    # Look for session ID in the response
-                                    response_str = json.dumps(result)
-                                    import re
-                                    match = re.search(r'"sessionId":"([^"]+)"', response_str)
-                                    if match:
-                                        self.session_id = match.group(1)
-                                        print(f"Session ID extracted: {self.session_id}")
-                                return result
-                            except json.JSONDecodeError:
-                                continue
-                else:
-                    return {"error": f"HTTP {response.status}: {await response.text()}"}
+            result = await self._post_mcp(self._init_body)
+            if result is not None:
+                session_id = _find_session_id(result)
+                if session_id:
+                    self.session_id = session_id
+                    self._session_headers = {"X-Session-ID": session_id}
+                    print(f"Session ID extracted: {self.session_id}")
+            return result
         except Exception as e:
             return {"error": f"Initialize failed: {str(e)}"}
     
     async def list_tools(self) -> Dict[str, Any]:
         """List available tools"""
         try:
-            payload = {
-                "jsonrpc": "2.0",
-                "id": "2",
-                "method": "tools/list"
-            }
-            
-            headers = {
-                "Content-Type": "application/json",
-                "Accept": "application/json, text/event-stream"
-            }
-            
-            # Add session ID if available
-            if self.session_id:
-                headers["X-Session-ID"] = self.session_id
-            
-            async with self.session.post(
-                f"{self.base_url}/mcp",
-                json=payload,
-                headers=headers
-            ) as response:
-                if response.status == 200:
-                    async for line in response.content:
-                        line = line.decode().strip()
-                        if line.startswith('data: '):
-                            data = line[6:]
-                            try:
-                                return json.loads(data)
-                            except json.JSONDecodeError:
-                                continue
-                else:
-                    return {"error": f"HTTP {response.status}: {await response.text()}"}
+            return await self._post_mcp(self._list_tools_body)
         except Exception as e:
             return {"error": f"List tools failed: {str(e)}"}
     
-    async def call_tool(self, name: str, arguments: Dict[str, Any] = None) -> Dict[str, Any]:
+    async def call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Call a tool"""
         try:
             payload = {
@@ -133,60 +216,64 @@ class FastMCPClient:
                 }
             }
             
-            headers = {
-                "Content-Type": "application/json",
-                "Accept": "application/json, text/event-stream"
-            }
-            
-            # Add session ID if available
-            if self.session_id:
-                headers["X-Session-ID"] = self.session_id
-            
-            async with self.session.post(
-                f"{self.base_url}/mcp",
-                json=payload,
-                headers=headers
-            ) as response:
-                if response.status == 200:
-                    async for line in response.content:
-                        line = line.decode().strip()
-                        if line.startswith('data: '):
-                            data = line[6:]
-                            try:
-                                result = json.loads(data)
-                                return result
-                            except json.JSONDecodeError:
-                                continue
-                else:
-                    return {"error": f"HTTP {response.status}: {await response.text()}"}
+            return await self._post_mcp(payload)
         except Exception as e:
             return {"error": f"Tool call failed: {str(e)}"}
 
+def _first_text(result: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Return result.result.content[0].text from a tool response, or None.
+
+    Flat dict.get chain instead of the nested membership-test ladder
+    the test methods each used to reimplement.
+    """
+    content = ((result or {}).get("result") or {}).get("content") or [{}]
+    first = content[0]
+    return first.get("text") if isinstance(first, dict) else None
+
+
 class FastMCPTester:
     """Test suite for FastMCP server functionality"""
     
-    def __init__(self, client: FastMCPClient):
+    def __init__(self, client: FastMCPClient, verbose: bool = False):
         self.client = client
-        self.results = []
-    
-    def log_test(self, test_name: str, success: bool, result: Any, details: str = ""):
+        self.results: List[Dict[str, Any]] = []
+        # Non-verbose runs buffer log lines and emit them in one write
+        # from print_summary instead of a flush per test
+        self.verbose = verbose
+        self._pending: List[Any] = []
+        # One wall-clock read at startup; per-test timestamps are
+        # cheap monotonic offsets formatted only when displayed
+        self._t0_wall = datetime.now()
+        self._t0_mono = time.monotonic()
+
+    def _format_ts(self, offset_s: float) -> str:
+        """Render a monotonic offset as a wall-clock HH:MM:SS stamp."""
+        return (self._t0_wall + timedelta(seconds=offset_s)).strftime("%H:%M:%S")
+
+    def log_test(self, test_name: str, success: bool, result: Any, details: str = "") -> None:
         """Log test results"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        offset_s = time.monotonic() - self._t0_mono
         status = "✅ PASS" if success else "❌ FAIL"
         self.results.append({
-            "timestamp": timestamp,
+            "timestamp": offset_s,
             "test": test_name,
             "success": success,
             "result": result,
             "details": details
         })
-        print(f"[{timestamp}] {status} {test_name}")
+        lines = [f"{status} {test_name}"]
         if details:
-            print(f"         {details}")
+            lines.append(f"         {details}")
         if not success and isinstance(result, dict) and "error" in result:
-            print(f"         Error: {result['error']}")
+            lines.append(f"         Error: {result['error']}")
+        if self.verbose:
+            lines[0] = f"[{self._format_ts(offset_s)}] {lines[0]}"
+            print("\n".join(lines))
+        else:
+            # Defer the strftime to print_summary along with the write
+            self._pending.append((offset_s, lines))
     
-    async def test_initialize(self):
+    async def test_initialize(self) -> bool:
         """Test MCP initialization"""
         print("\n🔗 Testing MCP Initialization...")
         result = await self.client.initialize()
@@ -201,7 +288,7 @@ class FastMCPTester:
         self.log_test("MCP Initialize", success, result, details)
         return success
     
-    async def test_list_tools(self):
+    async def test_list_tools(self) -> bool:
         """Test tools listing"""
         print("\n🛠️ Testing Tools List...")
         result = await self.client.list_tools()
@@ -210,149 +297,140 @@ class FastMCPTester:
         if success:
             tools = result["result"]["tools"]
             details = f"Found {len(tools)} tools"
-            print("     Available tools:")
-            for tool in tools:
-                print(f"       - {tool.get('name', 'unknown')}: {tool.get('description', 'no description')}")
+            # Build the listing in one string and print it once instead
+            # of a flush per tool
+            listing = "\n".join(
+                f"       - {tool.get('name', 'unknown')}: {tool.get('description', 'no description')}"
+                for tool in tools
+            )
+            print("     Available tools:\n" + listing)
         else:
             details = result.get("error", "Unknown error")
         
         self.log_test("Tools List", success, result, details)
         return success
     
-    async def test_health_check(self):
+    async def test_health_check(self) -> bool:
         """Test health check tool"""
         print("\n❤️ Testing Health Check...")
         result = await self.client.call_tool("health_check")
-        success = "result" in result and not result.get("error")
-        
+        success = isinstance(result, dict) and "result" in result and not result.get("error")
+
         if success:
-            tool_result = result.get("result", {})
-            if "content" in tool_result:
-                content = tool_result["content"]
-                if content and len(content) > 0:
-                    first_content = content[0]
-                    if "text" in first_content:
-                        details = f"Health status: {first_content['text']}"
-                    else:
-                        details = "Health check returned content"
-                else:
-                    details = "Health check completed"
-            else:
-                details = "Health check completed"
+            text = _first_text(result)
+            details = f"Health status: {text}" if text is not None else "Health check completed"
         else:
-            details = result.get("error", "Unknown error")
+            details = (result or {}).get("error", "Unknown error")
         
         self.log_test("Health Check", success, result, details)
         return success
     
-    async def test_schema_context(self):
+    async def test_schema_context(self) -> bool:
         """Test schema context retrieval"""
         print("\n📊 Testing Schema Context...")
         result = await self.client.call_tool("schema_context")
-        success = "result" in result and not result.get("error")
-        
+        success = isinstance(result, dict) and "result" in result and not result.get("error")
+
         if success:
-            tool_result = result.get("result", {})
-            if "content" in tool_result:
-                content = tool_result["content"]
-                if content and len(content) > 0:
-                    first_content = content[0]
-                    if "text" in first_content:
-                        schema_text = first_content["text"]
-                        details = f"Schema context length: {len(schema_text)} characters"
-                        
-                        # Show a snippet
-                        snippet = schema_text[:300] + "..." if len(schema_text) > 300 else schema_text
-                        print(f"     Schema preview:\n{snippet}")
-                    else:
-                        details = "Schema context returned"
-                else:
-                    details = "Empty schema context"
+            schema_text = _first_text(result)
+            if schema_text is not None:
+                details = f"Schema context length: {len(schema_text)} characters"
+
+                # Show a snippet
+                snippet = schema_text[:300] + "..." if len(schema_text) > 300 else schema_text
+                print(f"     Schema preview:\n{snippet}")
             else:
                 details = "Schema context completed"
         else:
-            details = result.get("error", "Unknown error")
+            details = (result or {}).get("error", "Unknown error")
         
         self.log_test("Schema Context", success, result, details)
         return success
     
-    async def test_simple_query(self):
+    async def test_simple_query(self) -> bool:
         """Test a simple BigQuery query"""
         print("\n📈 Testing Simple BigQuery Query...")
         
         test_query = "SELECT 1 as test_column, 'Hello World' as message"
         result = await self.client.call_tool("query_bigquery", {"query": test_query})
-        success = "result" in result and not result.get("error")
-        
+        success = isinstance(result, dict) and "result" in result and not result.get("error")
+
         if success:
-            tool_result = result.get("result", {})
-            if "content" in tool_result:
-                content = tool_result["content"]
-                if content and len(content) > 0:
-                    first_content = content[0]
-                    if "text" in first_content:
-                        try:
-                            query_result = json.loads(first_content["text"])
-                            if "results" in query_result:
-                                details = f"Query returned {len(query_result['results'])} rows"
-                                print(f"     Query: {test_query}")
-                                print(f"     Results: {query_result['results']}")
-                            else:
-                                details = "Query executed but no results key found"
-                        except json.JSONDecodeError:
-                            details = "Query returned non-JSON response"
+            text = _first_text(result)
+            if text is not None:
+                try:
+                    query_result = _json_loads(text)
+                    if "results" in query_result:
+                        details = f"Query returned {len(query_result['results'])} rows"
+                        print(f"     Query: {test_query}")
+                        print(f"     Results: {query_result['results']}")
                     else:
-                        details = "Query completed"
-                else:
-                    details = "Empty query result"
+                        details = "Query executed but no results key found"
+                except ValueError:
+                    details = "Query returned non-JSON response"
             else:
                 details = "Query completed"
         else:
-            details = result.get("error", "Unknown error")
+            details = (result or {}).get("error", "Unknown error")
         
         self.log_test("Simple BigQuery Query", success, result, details)
         return success
     
-    def print_summary(self):
+    def print_summary(self) -> None:
         """Print test summary"""
+        # Concurrent tests may log out of order; keep the report stable
+        self.results.sort(key=lambda r: r["timestamp"])
         total_tests = len(self.results)
         passed_tests = sum(1 for r in self.results if r["success"])
         failed_tests = total_tests - passed_tests
-        
-        print(f"\n{'='*60}")
-        print(f"🏁 TEST SUMMARY")
-        print(f"{'='*60}")
-        print(f"Total Tests: {total_tests}")
-        print(f"✅ Passed: {passed_tests}")
-        print(f"❌ Failed: {failed_tests}")
-        print(f"Success Rate: {(passed_tests/total_tests)*100:.1f}%")
-        
+
+        lines: List[str] = []
+        for offset_s, body in self._pending:
+            body[0] = f"[{self._format_ts(offset_s)}] {body[0]}"
+            lines.extend(body)
+        self._pending = []
+        lines.extend([
+            f"\n{'='*60}",
+            "🏁 TEST SUMMARY",
+            f"{'='*60}",
+            f"Total Tests: {total_tests}",
+            f"✅ Passed: {passed_tests}",
+            f"❌ Failed: {failed_tests}",
+            f"Success Rate: {(passed_tests/total_tests)*100:.1f}%",
+        ])
+
         if failed_tests > 0:
-            print(f"\n❌ Failed Tests:")
-            for result in self.results:
-                if not result["success"]:
-                    print(f"   - {result['test']}: {result.get('details', 'No details')}")
-        
-        print(f"\n{'='*60}")
+            lines.append("\n❌ Failed Tests:")
+            lines.extend(
+                f"   - {result['test']}: {result.get('details', 'No details')}"
+                for result in self.results if not result["success"]
+            )
+
+        lines.append(f"\n{'='*60}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
-async def run_tests(server_url: str):
+async def run_tests(server_url: str, verbose: bool = False) -> bool:
     """Run all tests against the FastMCP server"""
-    
+
     print("🚀 BigQuery FastMCP Server Test Suite")
     print(f"📡 Server URL: {server_url}")
     print(f"⏰ Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    
+
     async with FastMCPClient(server_url) as client:
-        tester = FastMCPTester(client)
+        tester = FastMCPTester(client, verbose=verbose)
         
-        # Run tests in sequence
+        # Initialize first; the remaining tests are independent
+        # read-only calls, so fan them out on the shared session
         init_ok = await tester.test_initialize()
-        
+
         if init_ok:
-            await tester.test_list_tools()
-            await tester.test_health_check()
-            await tester.test_schema_context()
-            await tester.test_simple_query()
+            await asyncio.gather(
+                tester.test_list_tools(),
+                tester.test_health_check(),
+                tester.test_schema_context(),
+                tester.test_simple_query(),
+            )
         else:
             print("❌ Initialization failed - skipping other tests")
         
@@ -362,7 +440,7 @@ async def run_tests(server_url: str):
         # Return success status
         return all(r["success"] for r in tester.results)
 
-async def interactive_mode(server_url: str):
+async def interactive_mode(server_url: str) -> None:
     """Interactive mode for manual testing"""
     print("🔧 Interactive Mode - Enter tool names to test")
     print("Commands: 'health_check', 'schema_context', 'query <SQL>', 'quit'")
@@ -376,50 +454,72 @@ async def interactive_mode(server_url: str):
             return
         
         print("✅ MCP session initialized")
-        
-        while True:
-            try:
-                command = input("\n> ").strip()
-                
-                if command.lower() in ['quit', 'exit', 'q']:
+
+        loop = asyncio.get_running_loop()
+
+        async def keep_warm():
+            # A cheap call every 30s keeps the pooled connection alive
+            # while the user is idle at the prompt, so the next command
+            # doesn't pay a TCP reconnect
+            while True:
+                await asyncio.sleep(30)
+                try:
+                    await client.call_tool("health_check")
+                except Exception:
+                    pass
+
+        warm_task = asyncio.create_task(keep_warm())
+
+        try:
+            while True:
+                try:
+                    # input() on a worker thread keeps the event loop
+                    # servicing connector housekeeping and the warm task
+                    command = (await loop.run_in_executor(None, input, "\n> ")).strip()
+
+                    if command.lower() in ['quit', 'exit', 'q']:
+                        break
+                    elif command.lower() == 'health_check':
+                        result = await client.call_tool("health_check")
+                        print(_json_pretty(result))
+                    elif command.lower() == 'schema_context':
+                        result = await client.call_tool("schema_context")
+                        print(_json_pretty(result))
+                    elif command.startswith('query '):
+                        sql = command[6:].strip()
+                        result = await client.call_tool("query_bigquery", {"query": sql})
+                        print(_json_pretty(result))
+                    elif command.lower() == 'tools':
+                        result = await client.list_tools()
+                        print(_json_pretty(result))
+                    elif command:
+                        # Try to call it as a tool
+                        result = await client.call_tool(command)
+                        print(_json_pretty(result))
+
+                except KeyboardInterrupt:
+                    print("\n👋 Goodbye!")
                     break
-                elif command.lower() == 'health_check':
-                    result = await client.call_tool("health_check")
-                    print(json.dumps(result, indent=2))
-                elif command.lower() == 'schema_context':
-                    result = await client.call_tool("schema_context")
-                    print(json.dumps(result, indent=2))
-                elif command.startswith('query '):
-                    sql = command[6:].strip()
-                    result = await client.call_tool("query_bigquery", {"query": sql})
-                    print(json.dumps(result, indent=2))
-                elif command.lower() == 'tools':
-                    result = await client.list_tools()
-                    print(json.dumps(result, indent=2))
-                elif command:
-                    # Try to call it as a tool
-                    result = await client.call_tool(command)
-                    print(json.dumps(result, indent=2))
-                
-            except KeyboardInterrupt:
-                print("\n👋 Goodbye!")
-                break
-            except Exception as e:
-                print(f"Error: {e}")
-
-def main():
+                except Exception as e:
+                    print(f"Error: {e}")
+        finally:
+            warm_task.cancel()
+
+def main() -> None:
     parser = argparse.ArgumentParser(description="Test client for BigQuery FastMCP Server")
     parser.add_argument("--url", default="http://localhost:8000", 
                        help="MCP server URL (default: http://localhost:8000)")
     parser.add_argument("--interactive", "-i", action="store_true",
                        help="Run in interactive mode")
-    
+    parser.add_argument("--verbose", "-v", action="store_true",
+                       help="Print test results live instead of buffering until the summary")
+
     args = parser.parse_args()
-    
+
     if args.interactive:
         asyncio.run(interactive_mode(args.url))
     else:
-        success = asyncio.run(run_tests(args.url))
+        success = asyncio.run(run_tests(args.url, verbose=args.verbose))
         sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
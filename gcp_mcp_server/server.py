@@ -1,8 +1,12 @@
 from fastmcp import FastMCP
-from controller.schema_context import get_schema_context, initialize_gcs_config
+from controller.schema_context import get_schema_context, get_table_names, initialize_gcs_config, refresh_schema_context
 from google.cloud import bigquery
 from google.cloud import storage
+import asyncio
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import uuid
 from pathlib import Path
 from dotenv import load_dotenv
 import json
@@ -19,21 +23,28 @@ credentials_path = str(Path(credentials_path).resolve())
 # Set the credentials environment variable
 os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = credentials_path
 
-# Initialize knowledge base GCS configuration if bucket path is provided
+# Constructing the BigQuery client and warming the schema context both
+# block on network round trips (ADC token exchange, knowledge-base
+# reads). Run them on two threads so startup pays the slower of the two
+# instead of their sum.
 knowledge_base_bucket = os.getenv('KNOWLEDGE_BASE_BUCKET')
-if knowledge_base_bucket:
-    print(f"Initializing knowledge base from GCS bucket: {knowledge_base_bucket}")
-    initialize_gcs_config(knowledge_base_bucket)
-else:
-    print("Using local knowledge base directory")
+with ThreadPoolExecutor(max_workers=2) as _warm_pool:
+    _bq_future = _warm_pool.submit(bigquery.Client)
+    if knowledge_base_bucket:
+        print(f"Initializing knowledge base from GCS bucket: {knowledge_base_bucket}")
+        _schema_future = _warm_pool.submit(initialize_gcs_config, knowledge_base_bucket)
+    else:
+        print("Using local knowledge base directory")
+        # Build the context now so the first schema_context call is a cache hit
+        _schema_future = _warm_pool.submit(refresh_schema_context)
 
-# Initialize BigQuery client
-try:
-    bq_client = bigquery.Client()
-except Exception as e:
-    print(f"Error initializing BigQuery client: {e}")
-    print(f"Using credentials from: {credentials_path}")
-    raise
+    try:
+        bq_client = _bq_future.result()
+    except Exception as e:
+        print(f"Error initializing BigQuery client: {e}")
+        print(f"Using credentials from: {credentials_path}")
+        raise
+    _schema_future.result()
 
 # Initialize Google Cloud Storage client
 try:
@@ -43,14 +54,52 @@ except Exception as e:
     print(f"Using credentials from: {credentials_path}")
     raise
 
+# BigQuery Storage API reads results as Arrow record batches - rows are
+# built in C from columnar buffers instead of per-cell Python Row
+# access. Optional; the REST path below still works without it.
+try:
+    from google.cloud import bigquery_storage
+except ImportError:
+    bigquery_storage = None
+
+_bqstorage_client = None
+
+def _get_bqstorage_client():
+    """Lazily create the shared BigQuery Storage read client."""
+    global _bqstorage_client
+    if _bqstorage_client is None and bigquery_storage is not None:
+        _bqstorage_client = bigquery_storage.BigQueryReadClient()
+    return _bqstorage_client
+
+def _rows_to_dicts(results):
+    """Materialize query results as a list of row dicts.
+
+    Prefers the Arrow path (columnar transport, C-level conversion via
+    to_pylist) and falls back to the per-row dict loop when the storage
+    client or pyarrow isn't available.
+    """
+    if bigquery_storage is not None:
+        try:
+            arrow_table = results.to_arrow(bqstorage_client=_get_bqstorage_client())
+            return arrow_table.to_pylist()
+        except Exception:
+            pass
+    # Pull the field names once and zip them against each row's values;
+    # dict(row) re-resolves the column mapping for every row
+    names = [field.name for field in results.schema]
+    return [dict(zip(names, row)) for row in results]
+
 # Initialize FastMCP Server
 mcp = FastMCP()
 
+# Shared constant response - health probes shouldn't allocate
+_HEALTH_OK = {"status": "healthy"}
+
 # Optional: Add a health check endpoint
 @mcp.tool()
 async def health_check():
     """Health check endpoint for the MCP server."""
-    return {"status": "healthy"}
+    return _HEALTH_OK
 
 # Define the MCP endpoints
 @mcp.tool()
@@ -63,6 +112,19 @@ def schema_context():
     """
     return get_schema_context()
 
+@mcp.tool()
+def prepare_context():
+    """Returns the available table names and the schema context in one call.
+
+    Merges what would otherwise be two sequential round trips (list
+    tables, then fetch schema) so clients pay a single request per
+    question.
+    """
+    return {
+        "tables": get_table_names(),
+        "schema_context": get_schema_context()
+    }
+
 @mcp.tool()
 async def query_bigquery(query: str):
     """Executes a BigQuery SQL query and returns the results.
@@ -78,10 +140,124 @@ async def query_bigquery(query: str):
     if not query:
         return {"error": "No query provided"}
 
-    query_job = bq_client.query(query)
-    results = query_job.result()
-    return {"results": [dict(row) for row in results]}
+    def _run_query():
+        query_job = bq_client.query(query)
+        return _rows_to_dicts(query_job.result())
+
+    # The BigQuery client is synchronous; run it on a worker thread so
+    # a long query doesn't stall every other tool call on the loop
+    rows = await asyncio.to_thread(_run_query)
+    return {"results": rows}
+
+# Server-side cursors for paged queries: {cursor_id: [last_used, pages]}.
+# Clients can crash without calling close_query, so cursors idle longer
+# than CURSOR_IDLE_TTL seconds are purged on the next cursor operation -
+# otherwise an abandoned iterator pins its buffered rows in memory
+# forever and the dict grows without bound.
+_query_cursors: Dict[str, Any] = {}
+CURSOR_IDLE_TTL = int(os.getenv("CURSOR_IDLE_TTL", "600"))
+
+def _purge_stale_cursors():
+    """Drop cursors that haven't been touched within CURSOR_IDLE_TTL."""
+    deadline = time.monotonic() - CURSOR_IDLE_TTL
+    stale = [cid for cid, entry in _query_cursors.items() if entry[0] < deadline]
+    for cid in stale:
+        _query_cursors.pop(cid, None)
+
+@mcp.tool()
+async def execute_query(query: str, page_size: int = 1000):
+    """Starts a paged BigQuery query and returns a cursor id.
+
+    Use fetch_next_page to pull result pages and close_query to release
+    the cursor early. Lets clients stream large results page by page
+    instead of materializing every row in one response.
+    """
+    if not query:
+        return {"error": "No query provided"}
+
+    def _start_query():
+        query_job = bq_client.query(query)
+        return iter(query_job.result(page_size=page_size).pages)
+
+    pages = await asyncio.to_thread(_start_query)
+    _purge_stale_cursors()
+    cursor_id = uuid.uuid4().hex
+    _query_cursors[cursor_id] = [time.monotonic(), pages]
+    return {"cursor": cursor_id}
+
+# Coalesce tiny pages up to this many encoded bytes per response so
+# each fetch amortizes its HTTP/SSE framing over a useful payload
+PAGE_BATCH_MIN_BYTES = 16384
+
+@mcp.tool()
+async def fetch_next_page(cursor: str):
+    """Fetches the next batch of rows for a cursor.
+
+    Returns {"rows": [...], "done": bool}; done=True means the cursor
+    is exhausted and has been released. Small underlying pages are
+    coalesced until roughly PAGE_BATCH_MIN_BYTES of row data has
+    accumulated, so clients don't pay a round trip per tiny page.
+    """
+    _purge_stale_cursors()
+    entry = _query_cursors.get(cursor)
+    if entry is None:
+        return {"error": "Unknown or closed cursor"}
+    entry[0] = time.monotonic()
+    pages = entry[1]
+
+    def _next_batch():
+        batched = []
+        est_bytes = 0
+        row_bytes = None
+        while est_bytes < PAGE_BATCH_MIN_BYTES:
+            try:
+                page = next(pages)
+            except StopIteration:
+                return batched if batched else None
+            rows = list(page)
+            if not rows:
+                continue
+            names = list(rows[0].keys())
+            batched.extend(dict(zip(names, row)) for row in rows)
+            if row_bytes is None:
+                # One sample encode estimates the per-row payload size
+                row_bytes = max(len(json.dumps(batched[0], default=str)), 1)
+            est_bytes = len(batched) * row_bytes
+        return batched
+
+    rows = await asyncio.to_thread(_next_batch)
+    if rows is None:
+        _query_cursors.pop(cursor, None)
+        return {"rows": [], "done": True}
+    return {"rows": rows, "done": False}
+
+@mcp.tool()
+async def close_query(cursor: str):
+    """Releases a paged-query cursor."""
+    _query_cursors.pop(cursor, None)
+    return {"status": "closed"}
+
+# ASGI entry point so production servers can run multiple workers:
+#   uvicorn server:app --workers 4 --loop uvloop --http httptools
+app = mcp.http_app()
 
 # Get port from environment variable, default to 8000
 port = int(os.getenv("PORT", 8000))
-mcp.run(transport="http", host="0.0.0.0", port=port)
\ No newline at end of file
+
+if __name__ == "__main__":
+    workers = int(os.getenv("WORKERS", "1"))
+    if workers > 1:
+        # Multi-worker serving scales past the single GIL-locked loop;
+        # uvicorn picks uvloop/httptools automatically when installed.
+        # MCP sessions and paged-query cursors live in process memory,
+        # so the proxy in front must pin each session to one worker -
+        # without affinity, follow-up POSTs land on workers that have
+        # never seen the session and fail non-deterministically.
+        print(f"WARNING: WORKERS={workers} requires session-affinity routing "
+              "(pin mcp-session-id to a worker; see deploy/nginx-mcp.conf). "
+              "Without it, sessions and query cursors break across workers.")
+        import uvicorn
+        uvicorn.run("server:app", host="0.0.0.0", port=port,
+                    workers=workers, log_level="warning")
+    else:
+        mcp.run(transport="http", host="0.0.0.0", port=port)
\ No newline at end of file